@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
-import re
+import os
+from builtins import TimeoutError as BuiltinTimeoutError
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from operator import attrgetter
+from typing import Optional, Dict, Any, Tuple
 from enum import Enum
 
 # ===================================================================
@@ -21,29 +23,25 @@ class BTIH(str):
     - %J provides the info hash v2 (SHA-256, 64 characters) 
     - We primarily use %I (v1) for compatibility with Arr applications
     """
-    # Pre-compile regex patterns for efficiency
-    _VALID_BTIH_32_PATTERN = re.compile(r'^[a-fA-F0-9]{32}$')  # Base32 encoded (DHT)
-    _VALID_BTIH_40_PATTERN = re.compile(r'^[a-fA-F0-9]{40}$')  # SHA-1 hex (standard)
-    _VALID_BTIH_64_PATTERN = re.compile(r'^[a-fA-F0-9]{64}$')  # SHA-256 hex (v2)
+    # Valid lengths: 32 (Base32 encoded, DHT), 40 (SHA-1 hex, standard), 64 (SHA-256 hex, v2)
+    _VALID_LENGTHS = frozenset((32, 40, 64))
+    _HEX_CHARS = frozenset('0123456789abcdefABCDEF')
 
     def __new__(cls, value):
+        # Already validated - BTIH instances are immutable, so reuse as-is
+        if type(value) is cls:
+            return value
+
         # Basic type check
         if not isinstance(value, str):
             raise TypeError(f"Expected a string for BTIH, but got {type(value).__name__}")
 
-        # Length and format validation
+        # Length and format validation (plain set check is much cheaper than regex matching)
         length = len(value)
-        if length == 32:
-            if not cls._VALID_BTIH_32_PATTERN.fullmatch(value):
-                raise ValueError("32-character BTIH must contain only hexadecimal characters (0-9, a-f, A-F)")
-        elif length == 40:
-            if not cls._VALID_BTIH_40_PATTERN.fullmatch(value):
-                raise ValueError("40-character BTIH must contain only hexadecimal characters (0-9, a-f, A-F)")
-        elif length == 64:
-            if not cls._VALID_BTIH_64_PATTERN.fullmatch(value):
-                raise ValueError("64-character BTIH must contain only hexadecimal characters (0-9, a-f, A-F)")
-        else:
+        if length not in cls._VALID_LENGTHS:
             raise ValueError(f"BTIH must be 32, 40, or 64 characters long, got {length}")
+        if not cls._HEX_CHARS.issuperset(value):
+            raise ValueError(f"{length}-character BTIH must contain only hexadecimal characters (0-9, a-f, A-F)")
 
         # Create the string object using the parent's __new__
         instance = super().__new__(cls, value)
@@ -52,17 +50,35 @@ class BTIH(str):
     def __repr__(self):
         return f"BTIH('{super().__str__()}')"
 
+# Placeholder values qBittorrent/shell scripts pass when a torrent has no v2 hash
+_HASH_V2_SENTINELS = frozenset(('', '-', 'None', 'null'))
+
+def _parse_hash_v2(value) -> Optional[BTIH]:
+    """Convert a raw hash_v2 value to BTIH, or None if it is missing or a placeholder"""
+    if not value or value in _HASH_V2_SENTINELS:
+        return None
+    try:
+        return BTIH(value)  # BTIH validates length and hex itself
+    except ValueError:
+        return None
+
 # ===================================================================
 # Service Status and Process Management
 # ===================================================================
 
-class ServiceStatus(Enum):
-    """Service process status enumeration"""
+class ServiceStatus(str, Enum):
+    """Service process status enumeration (str-valued, so members serialize directly to JSON)"""
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+# Module-level aliases for the status members used on hot paths (a single
+# global load instead of a class attribute lookup on the Enum)
+STATUS_RUNNING = ServiceStatus.RUNNING
+STATUS_COMPLETED = ServiceStatus.COMPLETED
+STATUS_FAILED = ServiceStatus.FAILED
+
+@dataclass(slots=True)
 class ProcessInfo:
     """Information about a running background process"""
     id: str
@@ -73,19 +89,23 @@ class ProcessInfo:
     end_time: Optional[float] = None
     duration: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
     """Item in the processing queue"""
     id: str
     torrent: 'TorrentInfo'  # Forward reference since TorrentInfo is defined later
     queued_time: float
     priority: int = 0  # Higher priority = processed first
+    
+    def as_heap_key(self) -> tuple:
+        """Ordering key for heapq: higher priority first, then older first (id breaks ties)"""
+        return (-self.priority, self.queued_time, self.id)
 
 # ===================================================================
 # Enhanced TorrentInfo Class
 # ===================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TorrentInfo:
     """
     Comprehensive torrent information class aligned with qBittorrent parameters.
@@ -121,6 +141,12 @@ class TorrentInfo:
     hash_v2: Optional[BTIH] = None   # %J - Info hash v2 (SHA-256, 64 chars)
     torrent_id: str = ""             # %K - qBittorrent internal torrent ID
     
+    # Serialized field order (class attribute, not a dataclass field)
+    _FIELDS = (
+        'hash_v1', 'name', 'content_path', 'save_path', 'root_path', 'size',
+        'num_files', 'category', 'tags', 'current_tracker', 'hash_v2', 'torrent_id'
+    )
+    
     # Computed properties for backward compatibility
     @property
     def hash(self) -> BTIH:
@@ -135,12 +161,29 @@ class TorrentInfo:
     @property
     def directory(self) -> str:
         """Directory containing the torrent content"""
-        import os
-        return os.path.dirname(self.content_path) if self.content_path else ""
+        # qBittorrent always reports absolute POSIX paths, so a plain string split
+        # is enough here (same result as os.path.dirname for these paths)
+        head, sep, _ = self.content_path.rpartition('/')
+        if not sep:
+            return ""
+        return head.rstrip('/') or '/'
+    
+    def hdd_paths(self, final_dest_base_hdd: str) -> Tuple[str, str]:
+        """
+        Build the HDD destination paths for this torrent in one place.
+        
+        Args:
+            final_dest_base_hdd: HDD base path (category subdirectory is appended)
+            
+        Returns:
+            tuple: (hdd_base_dir, expected_hdd_path)
+        """
+        hdd_base_dir = os.path.join(final_dest_base_hdd, self.category)
+        return hdd_base_dir, os.path.join(hdd_base_dir, self.name.strip())
     
     @property
     def is_multi_file(self) -> bool:
-        """True if torrent contains multiple files"""
+        """True if torrent contains multiple files (computed so it tracks later num_files updates)"""
         return self.num_files > 1
     
     @classmethod
@@ -152,7 +195,15 @@ class TorrentInfo:
             torrent_dict: Raw torrent dictionary from qBittorrent API
             files_count: Number of files (if known, avoids additional API call)
         """
-        import os
+        # qBittorrent returns tags as a comma-separated string, some callers pass a list
+        tags = torrent_dict.get('tags', '')
+        if type(tags) is list:
+            tags = ','.join(tags)
+        torrent_id = torrent_dict.get('id')
+        if torrent_id is None:
+            torrent_id = ''
+        elif type(torrent_id) is not str:
+            torrent_id = str(torrent_id)
         
         return cls(
             hash_v1=BTIH(torrent_dict.get('hash', '')),
@@ -162,11 +213,12 @@ class TorrentInfo:
             root_path=torrent_dict.get('root_path', ''),
             size=torrent_dict.get('size', 0),
             num_files=files_count if files_count is not None else torrent_dict.get('num_complete', 1),
-            category=torrent_dict.get('category', ''),
-            tags=','.join(torrent_dict.get('tags', [])) if isinstance(torrent_dict.get('tags'), list) else torrent_dict.get('tags', ''),
+            category=torrent_dict.get('category') or '',
+            tags=tags,
             current_tracker=torrent_dict.get('tracker', ''),
-            hash_v2=BTIH(torrent_dict.get('hash_v2', '')) if torrent_dict.get('hash_v2') and torrent_dict.get('hash_v2') not in ['', '-', 'None', 'null'] and len(torrent_dict.get('hash_v2', '')) >= 32 else None,
-            torrent_id=str(torrent_dict.get('id', ''))
+            # The Web API calls it infohash_v2; hash_v2 is accepted for callers passing our own names
+            hash_v2=_parse_hash_v2(torrent_dict.get('infohash_v2') or torrent_dict.get('hash_v2')),
+            torrent_id=torrent_id
         )
     
     @classmethod  
@@ -191,7 +243,7 @@ class TorrentInfo:
             category=params.get('category', ''),
             tags=params.get('tags', ''),
             current_tracker=params.get('tracker', ''),
-            hash_v2=BTIH(params.get('hash_v2', '')) if params.get('hash_v2') and params.get('hash_v2') not in ['', '-', 'None', 'null'] and len(params.get('hash_v2', '')) >= 32 else None,
+            hash_v2=_parse_hash_v2(params.get('hash_v2')),
             torrent_id=params.get('torrent_id', '')
         )
     
@@ -223,53 +275,42 @@ class TorrentInfo:
         Returns:
             Dictionary representation suitable for JSON serialization
         """
-        return {
-            'hash_v1': str(self.hash_v1),
-            'name': self.name,
-            'content_path': self.content_path,
-            'save_path': self.save_path,
-            'root_path': self.root_path,
-            'size': self.size,
-            'num_files': self.num_files,
-            'category': self.category,
-            'tags': self.tags,
-            'current_tracker': self.current_tracker,
-            'hash_v2': str(self.hash_v2) if self.hash_v2 else None,
-            'torrent_id': self.torrent_id
-        }
+        # BTIH is a str subclass, so hashes serialize to JSON as plain strings
+        return dict(zip(self._FIELDS, _get_torrent_fields(self)))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TorrentInfo':
         """
         Create TorrentInfo from dictionary (for deserialization).
         
+        Fields are passed positionally to the generated dataclass __init__,
+        which is cheaper than setting each attribute by name. Missing keys
+        get empty values, size 0 and a single file.
+        
         Args:
             data: Dictionary with TorrentInfo data
             
         Returns:
             TorrentInfo instance
         """
+        get = data.get
+        hash_v2 = get('hash_v2')
         return cls(
-            hash_v1=BTIH(data['hash_v1']),
-            name=data.get('name', ''),
-            content_path=data.get('content_path', ''),
-            save_path=data.get('save_path', ''),
-            root_path=data.get('root_path', ''),
-            size=data.get('size', 0),
-            num_files=data.get('num_files', 1),
-            category=data.get('category', ''),
-            tags=data.get('tags', ''),
-            current_tracker=data.get('current_tracker', ''),
-            hash_v2=BTIH(data['hash_v2']) if data.get('hash_v2') else None,
-            torrent_id=data.get('torrent_id', '')
+            BTIH(data['hash_v1']), get('name', ''), get('content_path', ''), get('save_path', ''),
+            get('size', 0), get('num_files', 1), get('root_path', ''), get('category', ''),
+            get('tags', ''), get('current_tracker', ''), BTIH(hash_v2) if hash_v2 else None,
+            get('torrent_id', '')
         )
 
+# Fetches all serialized TorrentInfo fields in one C-level call (slotted class has no __dict__)
+_get_torrent_fields = attrgetter(*TorrentInfo._FIELDS)
+
 # ===================================================================
 # Exception Classes
 # ===================================================================
 
-class TimeoutError(Exception):
-    """Custom timeout exception for operations that exceed time limits"""
+class TimeoutError(BuiltinTimeoutError):
+    """Timeout for operations that exceed time limits (caught by ``except TimeoutError`` either way)"""
     pass
 
 class LockError(Exception):
@@ -279,41 +320,40 @@ class LockError(Exception):
 # ===================================================================
 # Path Explanation for qBittorrent Parameters
 # ===================================================================
-"""
-qBittorrent Path Parameters Explanation:
-
-1. save_path (%D) - The base path where all torrent files and subfolders are stored.
-2. root_path (%R) - Absolute path of the first common subfolder; empty if no root folder.
-3. content_path (%F) - Absolute path of torrent content:
-   - For multifile torrents: same as root_path (if exists) or save_path
-   - For single-file torrents: absolute file path
-
-Examples with save path `/home/user/torrents`:
-
-Torrent A (multifile with root folder):
-  torrentA/
-    subdir1/file1
-    file2
-  
-  save_path:    /home/user/torrents
-  root_path:    /home/user/torrents/torrentA  
-  content_path: /home/user/torrents/torrentA
-
-Torrent B (multifile, "strip root folder" mode):
-  subdir1/file1
-  file2
-  
-  save_path:    /home/user/torrents
-  root_path:    <empty>
-  content_path: /home/user/torrents
-
-Torrent C (single file):
-  file1
-  
-  save_path:    /home/user/torrents
-  root_path:    <empty>
-  content_path: /home/user/torrents/file1
-
-For our application, content_path (%F) is typically the most useful as it points
-directly to the torrent content regardless of structure.
-""" 
\ No newline at end of file
+# qBittorrent Path Parameters Explanation:
+#
+# 1. save_path (%D) - The base path where all torrent files and subfolders are stored.
+# 2. root_path (%R) - Absolute path of the first common subfolder; empty if no root folder.
+# 3. content_path (%F) - Absolute path of torrent content:
+#    - For multifile torrents: same as root_path (if exists) or save_path
+#    - For single-file torrents: absolute file path
+#
+# Examples with save path `/home/user/torrents`:
+#
+# Torrent A (multifile with root folder):
+#   torrentA/
+#     subdir1/file1
+#     file2
+#
+#   save_path:    /home/user/torrents
+#   root_path:    /home/user/torrents/torrentA
+#   content_path: /home/user/torrents/torrentA
+#
+# Torrent B (multifile, "strip root folder" mode):
+#   subdir1/file1
+#   file2
+#
+#   save_path:    /home/user/torrents
+#   root_path:    <empty>
+#   content_path: /home/user/torrents
+#
+# Torrent C (single file):
+#   file1
+#
+#   save_path:    /home/user/torrents
+#   root_path:    <empty>
+#   content_path: /home/user/torrents/file1
+#
+# For our application, content_path (%F) is typically the most useful as it points
+# directly to the torrent content regardless of structure.
+ 
\ No newline at end of file
@@ -5,6 +5,7 @@
 # and easier management compared to environment variables.
 # ===================================================================
 
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -39,9 +40,10 @@ def find_config_file() -> Path:
         "No configuration file found. Please create config.toml from config.toml.example"
     )
 
-def load_config() -> Dict[str, Any]:
+def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
     """Load configuration from TOML file"""
-    config_file = find_config_file()
+    if config_file is None:
+        config_file = find_config_file()
     
     try:
         with open(config_file, 'rb') as f:
@@ -52,29 +54,33 @@ def load_config() -> Dict[str, Any]:
         print(f"ERROR: Failed to load configuration from {config_file}: {e}")
         sys.exit(1)
 
-# Load the configuration
-_config = load_config()
+def flatten_config(config: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested configuration into a single dict keyed by dot-notation paths.
+
+    Intermediate tables are kept as well, so 'paths.downloads' and
+    'paths.downloads.ssd' are both addressable.
+    """
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten_config(value, f"{path}."))
+    return flat
+
+# Locate and load the configuration (located once, reused by show_config_summary)
+_CONFIG_FILE = find_config_file()
+_config = load_config(_CONFIG_FILE)
+# Dot-path index of the configuration so lookups are a single dict access
+_FLAT = flatten_config(_config)
 
 # ===================================================================
 # Configuration Access Helpers
 # ===================================================================
 
-def get_nested(config: Dict[str, Any], path: str, default=None):
-    """Get nested configuration value using dot notation"""
-    keys = path.split('.')
-    value = config
-    
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return default
-    
-    return value
-
 def get_config(path: str, default=None, required: bool = False):
     """Get configuration value with optional requirement check"""
-    value = get_nested(_config, path, default)
+    value = _FLAT.get(path, default)
     
     if required and value is None:
         raise ValueError(f"Required configuration '{path}' not found")
@@ -88,16 +94,19 @@ def get_config(path: str, default=None, required: bool = False):
 
 def get_env_override(env_var: str, config_path: str, default=None, value_type=str):
     """Get value from environment variable or config file"""
-    env_value = os.getenv(env_var)
-    if env_value is not None:
-        if value_type == bool:
-            return env_value.lower() in ('true', '1', 'yes', 'on')
-        elif value_type == int:
-            return int(env_value)
-        else:
-            return env_value
+    env_value = os.environ.get(env_var)
+    if env_value is None:
+        # Common case: no override, read straight from the flattened config
+        return _FLAT.get(config_path, default)
     
-    return get_config(config_path, default)
+    if value_type == bool:
+        return env_value.lower() in ('true', '1', 'yes', 'on')
+    elif value_type == int:
+        return int(env_value)
+    elif value_type == float:
+        return float(env_value)
+    else:
+        return env_value
 
 # ===================================================================
 # Application Configuration
@@ -135,12 +144,19 @@ HTTP_API_KEY = get_env_override('HTTP_API_KEY', 'http_service.api_key', '')
 MAX_CONCURRENT_PROCESSES = get_env_override('MAX_CONCURRENT_PROCESSES', 'processing.concurrency.max_concurrent', 3, int)
 DISK_SPACE_THRESHOLD_GB = get_env_override('DISK_SPACE_THRESHOLD_GB', 'processing.storage.threshold_gb', 100, int)
 COPY_RETRY_ATTEMPTS = get_env_override('COPY_RETRY_ATTEMPTS', 'processing.copy.retry_attempts', 3, int)
+COPY_RETRY_BASE_DELAY = get_env_override('COPY_RETRY_BASE_DELAY', 'processing.copy.retry_base_delay', 2.0, float)
+COPY_RETRY_MAX_DELAY = get_env_override('COPY_RETRY_MAX_DELAY', 'processing.copy.retry_max_delay', 60.0, float)
 VERIFICATION_ENABLED = get_env_override('VERIFICATION_ENABLED', 'processing.copy.verification_enabled', True, bool)
+VERIFY_HASH = get_env_override('VERIFY_HASH', 'processing.copy.verify_hash', 'xxh3')
+FSYNC_AFTER_COPY = get_env_override('FSYNC_AFTER_COPY', 'processing.copy.fsync_after_copy', False, bool)
+DROP_CACHE_AFTER_COPY = get_env_override('DROP_CACHE_AFTER_COPY', 'processing.copy.drop_cache_after_copy', True, bool)
 
 # --- Performance Configuration ---
 MAX_CONCURRENT_COPY_OPERATIONS = get_env_override('MAX_CONCURRENT_COPY_OPERATIONS', 'performance.max_concurrent_copy_operations', 1, int)
 COPY_OPERATION_NICE_LEVEL = get_env_override('COPY_OPERATION_NICE_LEVEL', 'performance.copy_operation_nice_level', 10, int)
 COPY_BUFFER_SIZE = get_env_override('COPY_BUFFER_SIZE', 'performance.copy_buffer_size', 1048576, int)
+COPY_WORKERS = get_env_override('COPY_WORKERS', 'performance.copy_workers', 4, int)
+RELOCATE_PARALLELISM = get_env_override('RELOCATE_PARALLELISM', 'performance.relocate_parallelism', 2, int)
 
 # --- Notification Configuration ---
 NOTIFY_ARR_ENABLED = get_env_override('NOTIFY_ARR_ENABLED', 'notifications.enabled', True, bool)
@@ -148,18 +164,22 @@ NOTIFY_ARR_ENABLED = get_env_override('NOTIFY_ARR_ENABLED', 'notifications.enabl
 # Sonarr Configuration
 SONARR_URL = get_env_override('SONARR_URL', 'notifications.sonarr.url', 'http://sonarr:8989')
 SONARR_API_KEY = get_env_override('SONARR_API_KEY', 'notifications.sonarr.api_key', '')
-SONARR_TAG = get_env_override('SONARR_TAG', 'notifications.sonarr.tag', 'sonarr')
+SONARR_TAG = sys.intern(get_env_override('SONARR_TAG', 'notifications.sonarr.tag', 'sonarr'))
 
 # Radarr Configuration
 RADARR_URL = get_env_override('RADARR_URL', 'notifications.radarr.url', 'http://radarr:7878')
 RADARR_API_KEY = get_env_override('RADARR_API_KEY', 'notifications.radarr.api_key', '')
-RADARR_TAG = get_env_override('RADARR_TAG', 'notifications.radarr.tag', 'radarr')
+RADARR_TAG = sys.intern(get_env_override('RADARR_TAG', 'notifications.radarr.tag', 'radarr'))
+
+# Lowercased category -> Arr service to notify (Sonarr listed last so it wins if both tags match)
+ARR_SERVICE_BY_CATEGORY = {RADARR_TAG.lower(): "radarr", SONARR_TAG.lower(): "sonarr"}
 
 # --- Storage Location Tags ---
 ENABLE_LOCATION_TAGGING = get_env_override('ENABLE_LOCATION_TAGGING', 'storage_tags.enabled', True, bool)
 AUTO_TAG_NEW_TORRENTS = get_env_override('AUTO_TAG_NEW_TORRENTS', 'storage_tags.auto_tag_new', True, bool)
-SSD_LOCATION_TAG = get_env_override('SSD_LOCATION_TAG', 'storage_tags.ssd_tag', 'ssd')
-HDD_LOCATION_TAG = get_env_override('HDD_LOCATION_TAG', 'storage_tags.hdd_tag', 'hdd')
+# Tag names are interned since they are compared against torrent tags constantly
+SSD_LOCATION_TAG = sys.intern(get_env_override('SSD_LOCATION_TAG', 'storage_tags.ssd_tag', 'ssd'))
+HDD_LOCATION_TAG = sys.intern(get_env_override('HDD_LOCATION_TAG', 'storage_tags.hdd_tag', 'hdd'))
 
 # ===================================================================
 # Validation and Helper Functions
@@ -195,6 +215,18 @@ ARR_CONFIG = {
     "RADARR_API_KEY": RADARR_API_KEY
 }
 
+def _check_path(path: str):
+    """Return (exists, writable) for a path.
+
+    A single stat() answers existence; writability still goes through
+    os.access so read-only mounts, ACLs and root are judged by the kernel.
+    """
+    try:
+        os.stat(path)
+    except OSError:
+        return False, False
+    return True, os.access(path, os.W_OK)
+
 def validate_config():
     """Validate configuration values"""
     errors = []
@@ -242,6 +274,19 @@ def validate_config():
         errors.append("Copy retry attempts must be at least 1")
     elif COPY_RETRY_ATTEMPTS > 10:
         warnings.append(f"Copy retry attempts ({COPY_RETRY_ATTEMPTS}) seems excessive")
+    if COPY_RETRY_BASE_DELAY < 0 or COPY_RETRY_MAX_DELAY < 0:
+        errors.append("Copy retry delays must not be negative")
+    # Anything else is passed to hashlib.new() at copy time; shake_* need a length for hexdigest()
+    if VERIFY_HASH not in ('xxh3', 'xxh64', 'blake3') and (
+            VERIFY_HASH not in hashlib.algorithms_available or VERIFY_HASH.startswith('shake_')):
+        errors.append(f"Unsupported verify_hash '{VERIFY_HASH}': use xxh3, xxh64, blake3 "
+                      f"or a fixed-length hashlib algorithm such as sha256")
+    
+    # Check copy worker count
+    if COPY_WORKERS < 1:
+        errors.append("Copy workers must be at least 1")
+    if RELOCATE_PARALLELISM < 1:
+        errors.append("Relocate parallelism must be at least 1")
     
     # Check concurrent processes limit
     if MAX_CONCURRENT_PROCESSES < 1:
@@ -250,30 +295,34 @@ def validate_config():
         warnings.append(f"Max concurrent processes ({MAX_CONCURRENT_PROCESSES}) seems excessive")
     
     # Check paths exist (at runtime) - only if we're in a container environment
-    if os.path.exists('/config') and os.path.exists('/downloads'):  # Container-specific check
-        if not os.path.exists(DOWNLOAD_PATH_SSD):
+    config_dir_exists, _ = _check_path('/config')
+    downloads_dir_exists, _ = _check_path('/downloads')
+    if config_dir_exists and downloads_dir_exists:  # Container-specific check
+        ssd_exists, ssd_writable = _check_path(DOWNLOAD_PATH_SSD)
+        if not ssd_exists:
             errors.append(f"SSD download path '{DOWNLOAD_PATH_SSD}' does not exist")
-        elif not os.access(DOWNLOAD_PATH_SSD, os.W_OK):
+        elif not ssd_writable:
             errors.append(f"SSD download path '{DOWNLOAD_PATH_SSD}' is not writable")
             
-        if not os.path.exists(FINAL_DEST_BASE_HDD):
+        hdd_exists, hdd_writable = _check_path(FINAL_DEST_BASE_HDD)
+        if not hdd_exists:
             errors.append(f"HDD destination path '{FINAL_DEST_BASE_HDD}' does not exist")
-        elif not os.access(FINAL_DEST_BASE_HDD, os.W_OK):
+        elif not hdd_writable:
             errors.append(f"HDD destination path '{FINAL_DEST_BASE_HDD}' is not writable")
-    elif not os.path.exists('/config'):
+    elif not config_dir_exists:
         # Development/testing environment
         warnings.append("Running outside container environment - path validation skipped")
     
     # Validate log directory
     log_dir = os.path.dirname(LOG_FILE)
-    if os.path.exists('/config') and not os.path.exists(log_dir):
+    if config_dir_exists and not _check_path(log_dir)[0]:
         try:
             os.makedirs(log_dir, exist_ok=True)
         except Exception as e:
             warnings.append(f"Could not create log directory {log_dir}: {e}")
     
     # Validate state directory
-    if os.path.exists('/config') and not os.path.exists(LOCK_DIR):
+    if config_dir_exists and not _check_path(LOCK_DIR)[0]:
         try:
             os.makedirs(LOCK_DIR, exist_ok=True)
         except Exception as e:
@@ -284,7 +333,7 @@ def validate_config():
 def show_config_summary():
     """Display a summary of current configuration"""
     print("=== qBittorrent Manager Configuration ===")
-    print(f"Config Source: {find_config_file()}")
+    print(f"Config Source: {_CONFIG_FILE}")
     print(f"SSD Path: {DOWNLOAD_PATH_SSD}")
     print(f"HDD Path: {FINAL_DEST_BASE_HDD}")
     print(f"Space Threshold: {DISK_SPACE_THRESHOLD_GB} GB")
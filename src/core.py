@@ -1,22 +1,41 @@
 #!/usr/bin/env python3
 
 import os
+import stat
+import atexit
+import functools
 import shutil
 import time
+import heapq
+import random
 import requests
+import json
 import typing
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from classes import TorrentInfo, BTIH, TimeoutError
-from tags import add_hdd_tag, remove_ssd_tag
+from tags import add_hdd_tag, remove_ssd_tag, parse_tags
 from qbit import (
-    get_torrent_by_hash, get_torrents_by_status,
-    get_torrents_by_status_and_tag
+    get_torrents_by_status, get_torrents_by_status_and_tag, get_files_counts,
+    wait_for_torrents, PAUSED_STATES
 )
 from util import (
-    verify_copy, get_available_space_gb, cleanup_destination
+    verify_copy, get_available_space_gb, cleanup_destination, fastcopy,
+    parallel_copytree, copy_and_hash, stat_or_none, fast_rmtree,
+    is_permanent_copy_error, invalidate_space_cache, get_tree_sizes
 )
 # Import configuration constants
 import config
 
+# Optional fast JSON encoder (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import logging
 try:
     from logger import setup_logging
@@ -29,21 +48,83 @@ except ImportError:
 if typing.TYPE_CHECKING:
     from qbittorrentapi import Client as QBittorrentClient
 
+# ===================================================================
+# Arr HTTP Session
+# ===================================================================
+def _create_arr_session():
+    """Create a keep-alive session for Sonarr/Radarr requests.
+
+    Connections are pooled so repeated notifications reuse the same TCP/TLS
+    connection. Gateway errors are retried with a short backoff.
+    """
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["POST"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+_ARR_SESSION = _create_arr_session()
+
+def _json_body(payload) -> bytes:
+    """Encode a request body; Content-Type is already a session default."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+# Notifications are sent in the background so copy/relocation never waits on Arr
+_ARR_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="arr-notify")
+
+# Downloads waiting for their service's next batch: service_type -> [(hash, hdd_path)]
+_ARR_PENDING = {}
+_ARR_PENDING_LOCK = threading.Lock()
+# How long a scheduled batch waits for other finished torrents to join it (seconds)
+_ARR_BATCH_WINDOW = 1.0
+
+def close_sessions():
+    """Flush pending Arr notifications and close pooled HTTP connections.
+
+    Called on orchestrator shutdown and at exit.
+    """
+    _ARR_EXECUTOR.shutdown(wait=True)
+    _ARR_SESSION.close()
+
+# CLI runs don't go through Orchestrator.shutdown(); close the pool at exit too
+atexit.register(close_sessions)
+
 # ===================================================================
 # Core Action Functions
 # ===================================================================
-def notify_arr_scan_downloads(service_type, download_id: 'BTIH', arr_config, hdd_path: str = None):
-    """Notifies Sonarr or Radarr to scan for completed downloads using the command API.
+# All functions take the qBittorrent client as a parameter. Callers should
+# pass the long-lived client from qbit.get_qbit_client() so every API call
+# reuses its authenticated, pooled session.
+def notify_arr_scan_downloads_batch(service_type, items: typing.List[typing.Tuple['BTIH', typing.Optional[str]]], arr_config) -> int:
+    """Notifies Sonarr or Radarr to scan several completed downloads in one pass.
+
+    The Arr command API takes a single downloadClientId per command, so one
+    command is POSTed per item, back-to-back over the shared keep-alive session.
     
     Args:
         service_type: Either 'sonarr' or 'radarr'
-        download_id: Torrent hash for downloadClientId parameter
+        items: List of (torrent hash, HDD path or None) tuples
         arr_config: Configuration dictionary containing URLs and API keys
-        hdd_path: Path where the movie/episode was moved to on HDD
+    
+    Returns:
+        int: Number of commands accepted by the service
     """
+    if not items:
+        return 0
+
     if not arr_config.get("NOTIFY_ARR_ENABLED", False): 
         logger.info("Arr notification disabled, skipping.")
-        return
+        return 0
 
     if service_type == "sonarr":
         base_url = arr_config.get("SONARR_URL", "").rstrip('/')
@@ -57,202 +138,469 @@ def notify_arr_scan_downloads(service_type, download_id: 'BTIH', arr_config, hdd
         command_name = "DownloadedMoviesScan"  # Radarr command for scanning downloaded movies
     else: 
         logger.warning(f"Unknown service type '{service_type}' for notification.")
-        return
+        return 0
         
     if not base_url or not api_key: 
         logger.warning(f"{service_name} URL or API Key not configured. Skipping notification.")
-        return
+        return 0
 
     # Use the correct command API endpoint
     api_endpoint = f"{base_url}/api/v3/command"
-    headers = {
-        "X-Api-Key": api_key,
-        "Content-Type": "application/json"
-    }
-    
-    # Prepare command payload with downloadClientId and path for targeted scanning
-    payload = {
-        "name": command_name,
-        "downloadClientId": str(download_id)
-    }
-    
-    # Add path parameter if provided for more targeted scanning
-    if hdd_path:
-        payload["path"] = hdd_path
-        logger.info(f"Will scan specific path: {hdd_path}")
+    headers = {"X-Api-Key": api_key}
+    
+    # Prepare command payloads with downloadClientId and path for targeted scanning
+    payloads = []
+    for download_id, hdd_path in items:
+        payload = {
+            "name": command_name,
+            "downloadClientId": str(download_id)
+        }
+        # Add path parameter if provided for more targeted scanning
+        if hdd_path:
+            payload["path"] = hdd_path
+        payloads.append(payload)
     
     if config.DRY_RUN:
-        logger.info(f"[DRY RUN] Would notify {service_name} via POST {api_endpoint}")
-        logger.info(f"[DRY RUN] Command: {payload}")
-        return
+        logger.info(f"[DRY RUN] Would notify {service_name} via POST {api_endpoint} ({len(payloads)} command(s))")
+        for payload in payloads:
+            logger.info(f"[DRY RUN] Command: {payload}")
+        return 0
     
-    logger.info(f"Notifying {service_name} to scan for downloaded content...")
-    logger.info(f"Sending command '{command_name}' with downloadClientId: {download_id}")
-    if hdd_path:
-        logger.info(f"Target path: {hdd_path}")
+    logger.info(f"Notifying {service_name} to scan {len(payloads)} downloaded item(s) with '{command_name}'...")
     
-    try:
-        response = requests.post(api_endpoint, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        if response.status_code in [200, 201, 202]:
-            logger.info(f"{service_name} command sent successfully (Status: {response.status_code}).")
-            try: 
-                response_json = response.json()
-                command_id = response_json.get('id', 'Unknown')
-                logger.info(f"Command queued with ID: {command_id}")
-                logger.debug(f"Response: {str(response_json)[:200]}...")
-            except requests.exceptions.JSONDecodeError: 
-                logger.debug(f"Response Text: {response.text[:200]}...")
-        else: 
-            logger.warning(f"{service_name} command returned unexpected status: {response.status_code}")
-            logger.debug(f"Response: {response.text[:200]}...")
+    sent = 0
+    for payload in payloads:
+        download_id = payload["downloadClientId"]
+        logger.debug("Sending command '%s' with downloadClientId: %s (path: %s)", command_name, download_id, payload.get('path'))
+        try:
+            response = _ARR_SESSION.post(api_endpoint, headers=headers, data=_json_body(payload), timeout=(5, 30))
+            response.raise_for_status()
             
-    except requests.exceptions.RequestException as e: 
-        logger.error(f"ERROR notifying {service_name}: {e}")
-    except Exception as e: 
-        logger.error(f"Unexpected error during {service_name} notification: {e}")
+            if response.status_code in [200, 201, 202]:
+                sent += 1
+                # The response body is only ever logged; don't parse it unless it will be
+                if logger.isEnabledFor(logging.DEBUG):
+                    try: 
+                        response_json = response.json()
+                        logger.debug("Command for %s queued with ID: %s", download_id, response_json.get('id', 'Unknown'))
+                        logger.debug("Response: %.200s...", response_json)
+                    except requests.exceptions.JSONDecodeError: 
+                        logger.debug("Response Text: %.200s...", response.text)
+            else: 
+                logger.warning(f"{service_name} command for {download_id} returned unexpected status: {response.status_code}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response: %.200s...", response.text)
+                
+        except requests.exceptions.RequestException as e: 
+            logger.error(f"ERROR notifying {service_name} for {download_id}: {e}")
+        except Exception as e: 
+            logger.error(f"Unexpected error during {service_name} notification for {download_id}: {e}")
 
+    logger.info(f"{service_name} accepted {sent}/{len(payloads)} scan command(s).")
+    return sent
 
-def relocate_and_delete_ssd(client: 'QBittorrentClient', torrent_info: 'TorrentInfo', final_dest_base_hdd: str, download_path_ssd: str):
-    """ Stops torrent, sets qBittorrent location to HDD path, deletes SSD copy, restarts. Uses qBittorrent API."""
-    hdd_base_dir = os.path.join(final_dest_base_hdd, torrent_info.category)
-    logger.info(f"Attempting relocation for {torrent_info.hash} ('{torrent_info.name}'):")
-    logger.info(f"SSD path (to delete): {torrent_info.path}")
-    logger.info(f"Target HDD base dir (for qBittorrent): {hdd_base_dir}")
+def _take_pending_arr_items(service_type):
+    """Remove and return the downloads queued for service_type's next batch."""
+    with _ARR_PENDING_LOCK:
+        return _ARR_PENDING.pop(service_type, [])
 
-    if config.DRY_RUN:
-        logger.info(f"[DRY RUN] Would relocate torrent {torrent_info.hash} from SSD to HDD")
-        logger.info(f"[DRY RUN] Would stop torrent, update directory to {hdd_base_dir}, delete {torrent_info.path}, restart torrent")
-        return True
+def _flush_arr_batch(service_type, arr_config, window: float) -> int:
+    """Wait window seconds for more downloads to queue up, then send them all in one batch."""
+    if window > 0:
+        time.sleep(window)
+    return notify_arr_scan_downloads_batch(service_type, _take_pending_arr_items(service_type), arr_config)
 
-    was_started = False; start_successful = True; delete_successful = False
+def notify_arr_scan_downloads(service_type, download_id: 'BTIH', arr_config, hdd_path: str = None):
+    """Notifies Sonarr or Radarr to scan for completed downloads using the command API.
+    
+    The download is queued per service; the first one schedules a batch on the
+    notification executor, and torrents finishing within _ARR_BATCH_WINDOW
+    seconds join it, so concurrent workers share one notification pass.
+    
+    Args:
+        service_type: Either 'sonarr' or 'radarr'
+        download_id: Torrent hash for downloadClientId parameter
+        arr_config: Configuration dictionary containing URLs and API keys
+        hdd_path: Path where the movie/episode was moved to on HDD
+    
+    Returns:
+        Future for a newly scheduled batch, or None if the download joined an
+        already scheduled batch or nothing was sent in the background
+    """
+    item = (download_id, hdd_path)
+    if config.DRY_RUN or not arr_config.get("NOTIFY_ARR_ENABLED", False):
+        # Nothing goes over the network; just log what would happen
+        notify_arr_scan_downloads_batch(service_type, [item], arr_config)
+        return None
+    
+    with _ARR_PENDING_LOCK:
+        pending = _ARR_PENDING.setdefault(service_type, [])
+        pending.append(item)
+        if len(pending) > 1:
+            # A batch for this service is already scheduled and will pick this up
+            return None
+    
+    # Errors are logged inside the worker, nothing downstream needs the result
+    try:
+        return _ARR_EXECUTOR.submit(_flush_arr_batch, service_type, arr_config, _ARR_BATCH_WINDOW)
+    except RuntimeError:
+        # Executor already shut down (close_sessions ran); send it inline instead
+        logger.debug("Notification executor is shut down, notifying %s synchronously", service_type)
+        notify_arr_scan_downloads_batch(service_type, _take_pending_arr_items(service_type), arr_config)
+        return None
+
+
+# Seconds a free-space reading is reused by manage_ssd_space
+SPACE_CHECK_MAX_AGE = 5
+
+# qBittorrent states in which a torrent must be paused before relocation
+ACTIVE_STATES = frozenset((
+    'downloading', 'uploading', 'stalledDL', 'stalledUP', 'queuedDL', 'queuedUP',
+    'checkingDL', 'checkingUP', 'forcedDL', 'forcedUP'
+))
+
+@functools.lru_cache(maxsize=128)
+def _canonical_path(path: str) -> str:
+    """Resolve a configured root directory once (realpath lstat()s every path component)."""
+    return os.path.normpath(os.path.realpath(path))
+
+def _is_within(path: str, root: str) -> bool:
+    """String-only containment check for two normalized absolute paths."""
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+def _device_of(path: str):
+    """Return st_dev of path, or of its nearest existing parent if it doesn't exist yet."""
+    while True:
+        st = stat_or_none(path)
+        if st is not None:
+            return st.st_dev
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+def _hdd_copy_complete(src_path: str, src_stat: os.stat_result, dst_path: str, dst_stat: os.stat_result) -> bool:
+    """Cheap completeness check of an existing HDD copy: same type, and every source file present with its size.
+
+    Extra files at the destination (subtitles, .nfo files, unpacked archives
+    written by post-processing) don't make the copy incomplete.
+    """
+    if stat.S_ISDIR(src_stat.st_mode) != stat.S_ISDIR(dst_stat.st_mode):
+        return False
+    if stat.S_ISDIR(src_stat.st_mode):
+        for relpath, size in get_tree_sizes(src_path).items():
+            st = stat_or_none(os.path.join(dst_path, relpath))
+            if st is None or st.st_size != size:
+                return False
+        return True
+    return src_stat.st_size == dst_stat.st_size
 
+def _ensure_hdd_copy(torrent_info: 'TorrentInfo', hdd_base_dir: str, expected_hdd_path: str,
+                     src_stat: typing.Optional[os.stat_result] = None) -> bool:
+    """Make sure the torrent data exists on the HDD, copying and verifying it if needed.
+    
+    src_stat is the caller's stat of the SSD data (None if it is missing); its
+    type bits decide between a tree and a single-file copy.
+    """
+    # CRITICAL: Verify destination exists before deleting source
+    logger.info(f"Verifying destination exists at: {expected_hdd_path}")
+    
+    dst_stat = stat_or_none(expected_hdd_path)
+    if dst_stat is not None:
+        if src_stat is None:
+            logger.info(f"Destination already exists on HDD (SSD data already gone).")
+            return True
+        # An interrupted earlier relocation can leave a half-populated destination
+        if _hdd_copy_complete(torrent_info.path, src_stat, expected_hdd_path, dst_stat):
+            logger.info(f"Destination complete on HDD (size match).")
+            return True
+        logger.warning(f"Destination '{expected_hdd_path}' exists but is incomplete. Copying again...")
+        cleanup_destination(expected_hdd_path)
+    else:
+        logger.warning(f"Destination path '{expected_hdd_path}' does not exist!")
+        if src_stat is None:
+            logger.error(f"SSD data '{torrent_info.path}' is missing too. Nothing to copy.")
+            return False
+    logger.info(f"Need to copy data from SSD to HDD first...")
+    is_multi = stat.S_ISDIR(src_stat.st_mode)
     try:
-        # Get torrent info from qBittorrent
-        try:
-            torrent = get_torrent_by_hash(client, str(torrent_info.hash))
-        except ValueError:
-            logger.error(f"Torrent {torrent_info.hash} not found for relocation.")
+        # Ensure base directory exists
+        os.makedirs(hdd_base_dir, exist_ok=True)
+        
+        copy_start_time = time.time()
+        src_digest = None
+        manifest = None
+        if is_multi:
+            # Checksums are taken from the copy's own read stream so verification skips the SSD
+            manifest = {} if config.VERIFICATION_ENABLED else None
+            parallel_copytree(torrent_info.path, expected_hdd_path, workers=config.COPY_WORKERS, manifest=manifest)
+        elif config.VERIFICATION_ENABLED:
+            src_digest = copy_and_hash(torrent_info.path, expected_hdd_path, buffer_size=config.COPY_BUFFER_SIZE)
+        else:
+            fastcopy(torrent_info.path, expected_hdd_path)
+        logger.info(f"Copy completed in {time.time() - copy_start_time:.2f} seconds.")
+        
+        # Verify the copy was successful
+        if not verify_copy(torrent_info.path, expected_hdd_path, is_multi,
+                           src_digest=src_digest, manifest=manifest):
+            logger.error(f"Copy verification failed!")
             return False
+        logger.info(f"Copy verification successful.")
+        return True
+    except (shutil.Error, OSError) as e:
+        logger.error(f"Failed to copy data to HDD: {e}")
+        # Don't leave a partial copy that looks like an existing destination next time
+        cleanup_destination(expected_hdd_path)
+        return False
 
-        logger.info("Checking torrent state via qBittorrent API...")
-        # Check if torrent is active (downloading or uploading)
-        if torrent.state in ['downloading', 'uploading', 'stalledDL', 'stalledUP', 'queuedDL', 'queuedUP', 'checkingDL', 'checkingUP', 'forcedDL', 'forcedUP']:
-            logger.info("Torrent is active. Pausing via qBittorrent API...")
-            was_started = True
-            client.torrents_pause(torrent_hashes=str(torrent_info.hash))
-            logger.info("Pause command sent.")
-            time.sleep(1)
+def _delete_ssd_data(torrent_info: 'TorrentInfo', download_path_ssd: str,
+                     ssd_stat: typing.Optional[os.stat_result] = None) -> bool:
+    """Delete the torrent's SSD data after checking it lies inside the SSD download path.
+    
+    ssd_stat is the caller's lstat of the SSD data (None if it is missing); a
+    symlink is unlinked itself, never followed into a tree removal.
+    """
+    logger.info(f"Destination verified. Proceeding to delete SSD data at: {torrent_info.path}")
+    
+    # Safety check before deletion
+    try:
+        norm_ssd_dl_path = _canonical_path(download_path_ssd)
+        # The data path itself is still fully resolved so a symlink can't point the delete elsewhere
+        norm_ssd_data_path = os.path.normpath(os.path.realpath(torrent_info.path))
+        if not _is_within(norm_ssd_data_path, norm_ssd_dl_path):
+            logger.error(f"SAFETY ERROR: Path '{norm_ssd_data_path}' not within '{norm_ssd_dl_path}'. Aborting delete.")
+            return False
+    except FileNotFoundError: 
+        logger.warning(f"SSD path '{torrent_info.path}' not found for safety check.")
+        return True
+    except Exception as e: 
+        logger.error(f"Error during safety check: {e}")
+        return False
+    
+    # Delete SSD data only if safety check passed
+    try:
+        # The caller's single stat gives existence and type (no exists/isdir/isfile)
+        if ssd_stat is not None:
+            if stat.S_ISLNK(ssd_stat.st_mode):
+                os.unlink(torrent_info.path)
+                logger.info(f"Successfully deleted SSD symlink.")
+            elif stat.S_ISDIR(ssd_stat.st_mode): 
+                fast_rmtree(torrent_info.path)
+                logger.info(f"Successfully deleted SSD directory.")
+            elif stat.S_ISREG(ssd_stat.st_mode): 
+                os.remove(torrent_info.path)
+                logger.info(f"Successfully deleted SSD file.")
         else: 
-            logger.info("Torrent is already paused.")
+            logger.warning(f"SSD path not found for deletion (already gone).")
+        return True
+    except OSError as e: 
+        logger.error(f"Error deleting SSD data: {e}")
+        return False
 
-        logger.info("Updating torrent location via qBittorrent API...")
-        # In qBittorrent, we use set_location to move the torrent base directory
-        client.torrents_set_location(location=hdd_base_dir, torrent_hashes=str(torrent_info.hash))
-        logger.info("Successfully updated torrent location.")
-        time.sleep(0.5)
+# Seconds to wait for qBittorrent to report a relocated torrent at its new save path
+# and out of the 'moving' state before its SSD data may be deleted
+RELOCATION_MOVE_TIMEOUT = 30.0
 
-        # CRITICAL: Verify destination exists before deleting source
-        expected_hdd_path = os.path.join(hdd_base_dir, torrent_info.name.strip())
-        logger.info(f"Verifying destination exists at: {expected_hdd_path}")
+def _wait_for_relocation(client: 'QBittorrentClient', by_dest: typing.Dict[str, typing.List[str]],
+                         timeout: float) -> typing.Set[str]:
+    """Wait for set_location to take effect and return the hashes that have fully moved.
+    
+    A torrent counts as moved once its save_path is the new directory and qBittorrent
+    no longer reports it as 'moving', so its SSD data is no longer being read.
+    
+    Args:
+        client: qBittorrent client instance
+        by_dest: Destination directory -> hashes sent to it with set_location
+        timeout: Maximum time to wait in seconds
         
-        if not os.path.exists(expected_hdd_path):
-            logger.warning(f"Destination path '{expected_hdd_path}' does not exist!")
-            logger.info(f"Need to copy data from SSD to HDD first...")
-            
-            if config.DRY_RUN:
-                logger.info(f"[DRY RUN] Would copy {'directory' if torrent_info.is_multi_file else 'file'} from {torrent_info.path} to {expected_hdd_path}")
-            else:
-                try:
-                    # Ensure base directory exists
-                    os.makedirs(hdd_base_dir, exist_ok=True)
-                    
-                    copy_start_time = time.time()
-                    if torrent_info.is_multi_file:
-                        shutil.copytree(torrent_info.path, expected_hdd_path, copy_function=shutil.copy2, dirs_exist_ok=True)
-                    else:
-                        shutil.copy2(torrent_info.path, expected_hdd_path)
-                    logger.info(f"Copy completed in {time.time() - copy_start_time:.2f} seconds.")
-                    
-                    # Verify the copy was successful
-                    # Note: verify_copy already imported at top of file
-                    if not verify_copy(torrent_info.path, expected_hdd_path, torrent_info.is_multi_file):
-                        logger.error(f"Copy verification failed!")
-                        if was_started: 
-                            logger.info("Attempting to resume torrent after copy failure...")
-                            client.torrents_resume(torrent_hashes=str(torrent_info.hash))
-                        return False
-                    logger.info(f"Copy verification successful.")
-                    
-                except (shutil.Error, OSError) as e:
-                    logger.error(f"Failed to copy data to HDD: {e}")
-                    if was_started: 
-                        logger.info("Attempting to resume torrent after copy failure...")
-                        client.torrents_resume(torrent_hashes=str(torrent_info.hash))
-                    return False
-        else:
-            logger.info(f"Destination already exists on HDD.")
-
-        logger.info(f"Destination verified. Proceeding to delete SSD data at: {torrent_info.path}")
+    Returns:
+        set: Hashes (as passed in) whose move has finished
+    """
+    expected = {h.lower(): d.rstrip('/') for d, hashes in by_dest.items() for h in hashes}
+    
+    def moved(t) -> bool:
+        return t.state != 'moving' and (t.save_path or '').rstrip('/') == expected.get(str(t.hash).lower())
+    
+    if not wait_for_torrents(client, list(expected), moved, timeout=timeout):
+        logger.warning(f"Not every torrent finished moving within {timeout:.0f}s.")
+        try:
+            torrents = client.torrents_info(torrent_hashes='|'.join(expected))
+        except Exception as e:
+            logger.error(f"Failed to check torrent locations: {e}")
+            return set()
+        done = {str(t.hash).lower() for t in torrents if moved(t)}
+        return {h for hashes in by_dest.values() for h in hashes if h.lower() in done}
+    logger.info("Successfully updated torrent location.")
+    return {h for hashes in by_dest.values() for h in hashes}
+
+def relocate_and_delete_ssd_batch(client: 'QBittorrentClient', torrent_infos: typing.List['TorrentInfo'],
+                                  final_dest_base_hdd: str, download_path_ssd: str,
+                                  initial_states: typing.Optional[typing.Dict[str, str]] = None) -> typing.Dict[str, bool]:
+    """
+    Relocate several torrents from SSD to HDD with batched qBittorrent API calls.
+    
+    Torrents are grouped by destination device. Within a group, every HDD copy is
+    completed and verified first, while qBittorrent still points at the SSD, so no
+    cleanup or copy here can race a qBittorrent move into the same directory. Pause
+    and set_location (once per destination directory) are then sent for the group's
+    torrents, since the Web API accepts pipe-joined hash lists, and the SSD data is
+    only deleted once qBittorrent reports the new save path and has stopped moving.
+    
+    Args:
+        client: qBittorrent client instance
+        torrent_infos: Torrents to relocate
+        final_dest_base_hdd: HDD base path (category subdirectories are appended)
+        download_path_ssd: SSD download path (deletions are restricted to it)
+        initial_states: Optional hash -> qBittorrent state from the caller's own listing;
+            when it covers every torrent the state lookup call is skipped
         
-        # Safety check before deletion
+    Returns:
+        dict: Maps torrent hash (str) to True if relocated and deleted successfully
+    """
+    results = {}
+    targets = {}  # hash -> (torrent_info, hdd_base_dir, expected_hdd_path)
+    for torrent_info in torrent_infos:
+        hdd_base_dir, expected_hdd_path = torrent_info.hdd_paths(final_dest_base_hdd)
+        logger.info(f"Attempting relocation for {torrent_info.hash} ('{torrent_info.name}'):")
+        logger.info(f"SSD path (to delete): {torrent_info.path}")
+        logger.info(f"Target HDD base dir (for qBittorrent): {hdd_base_dir}")
+        targets[str(torrent_info.hash)] = (torrent_info, hdd_base_dir, expected_hdd_path)
+    
+    if not targets:
+        return results
+    
+    if config.DRY_RUN:
+        for hash_str, (torrent_info, hdd_base_dir, _) in targets.items():
+            logger.info(f"[DRY RUN] Would relocate torrent {hash_str} from SSD to HDD")
+            logger.info(f"[DRY RUN] Would stop torrent, update directory to {hdd_base_dir}, delete {torrent_info.path}, restart torrent")
+            results[hash_str] = True
+        return results
+    
+    was_started = []
+    resumed = set()  # Torrents already resumed by their own device group
+    
+    def resume(hashes):
+        """Resume torrents, returning False if qBittorrent rejected the command."""
         try:
-            norm_ssd_dl_path = os.path.normpath(os.path.realpath(download_path_ssd))
-            norm_ssd_data_path = os.path.normpath(os.path.realpath(torrent_info.path))
-            if os.path.commonpath([norm_ssd_data_path, norm_ssd_dl_path]) != norm_ssd_dl_path:
-                logger.error(f"SAFETY ERROR: Path '{norm_ssd_data_path}' not within '{norm_ssd_dl_path}'. Aborting delete.")
-                if was_started: 
-                    logger.info("Attempting to resume torrent after safety check failure...")
-                    client.torrents_resume(torrent_hashes=str(torrent_info.hash))
-                return False
-        except FileNotFoundError: 
-            logger.warning(f"SSD path '{torrent_info.path}' not found for safety check.")
-            delete_successful = True
-        except Exception as e: 
-            logger.error(f"Error during safety check: {e}")
+            logger.info(f"Resuming {len(hashes)} torrent(s) via qBittorrent API...")
+            client.torrents_resume(torrent_hashes='|'.join(hashes))
+            logger.info("Resume command sent.")
+            resumed.update(hashes)
+            return True
+        except Exception as restart_e: 
+            logger.error(f"Failed to send resume command: {restart_e}")
             return False
-
-        # Delete SSD data only if safety check passed/path already gone
-        if not delete_successful:
+    
+    try:
+        if initial_states is not None and all(h in initial_states for h in targets):
+            # Caller already listed these torrents; reuse their states
+            states = initial_states
+        else:
+            # Get current state of all torrents in one call
+            torrents = client.torrents_info(torrent_hashes='|'.join(targets))
+            found = {str(t.hash).lower(): t.state for t in torrents}
+            states = {h: found[h.lower()] for h in targets if h.lower() in found}
+        for hash_str in list(targets):
+            state = states.get(hash_str)
+            if state is None:
+                logger.error(f"Torrent {hash_str} not found for relocation.")
+                results[hash_str] = False
+                del targets[hash_str]
+            elif state == 'moving':
+                # An earlier set_location is still writing to the HDD; leave it alone this run
+                logger.warning(f"Torrent {hash_str} is still being moved by qBittorrent. Skipping relocation.")
+                results[hash_str] = False
+                del targets[hash_str]
+            elif state in ACTIVE_STATES:
+                was_started.append(hash_str)
+        
+        if not targets:
+            return results
+        
+        def relocate_group(items):
+            # Torrents sharing a destination disk are copied serially
+            ready = []
+            for hash_str, (torrent_info, hdd_base_dir, expected_hdd_path) in items:
+                # One lstat of the SSD data serves both the copy and the delete; only a
+                # symlink needs a second stat, since the copy reads through it
+                ssd_lstat = stat_or_none(torrent_info.path, follow_symlinks=False)
+                src_stat = ssd_lstat
+                if ssd_lstat is not None and stat.S_ISLNK(ssd_lstat.st_mode):
+                    src_stat = stat_or_none(torrent_info.path)
+                # Completed torrents only read their data, so they keep seeding during the copy
+                if _ensure_hdd_copy(torrent_info, hdd_base_dir, expected_hdd_path, src_stat):
+                    ready.append((hash_str, torrent_info, hdd_base_dir, ssd_lstat))
+                else:
+                    results[hash_str] = False
+            if not ready:
+                return
+            
+            to_pause = [hash_str for hash_str, *_ in ready if hash_str in was_started]
             try:
-                if os.path.exists(torrent_info.path):
-                    if os.path.isdir(torrent_info.path): 
-                        shutil.rmtree(torrent_info.path)
-                        logger.info(f"Successfully deleted SSD directory.")
-                    elif os.path.isfile(torrent_info.path): 
-                        os.remove(torrent_info.path)
-                        logger.info(f"Successfully deleted SSD file.")
-                    delete_successful = True
-                else: 
-                    logger.warning(f"SSD path not found for deletion (already gone).")
-                    delete_successful = True
-            except OSError as e: 
-                logger.error(f"Error deleting SSD data: {e}")
-                delete_successful = False
-
-        # Update location tags if tagging is enabled
-        if delete_successful:
-            remove_ssd_tag(client, torrent_info.hash)
-
-        # Restart torrent if it was originally running
-        if was_started:
-            logger.info("Resuming torrent via qBittorrent API...")
-            client.torrents_resume(torrent_hashes=str(torrent_info.hash))
-            logger.info("Resume command sent.")
-            start_successful = True # Assume success if no exception
-
-        return delete_successful and start_successful
-
+                if to_pause:
+                    logger.info(f"Pausing {len(to_pause)} active torrent(s) via qBittorrent API...")
+                    client.torrents_pause(torrent_hashes='|'.join(to_pause))
+                    logger.info("Pause command sent.")
+                    # Polling returns as soon as they report paused; the timeout only matters under load
+                    if not wait_for_torrents(client, to_pause, lambda t: t.state in PAUSED_STATES, timeout=2.0):
+                        logger.warning("Torrents did not report a paused state within 2s; continuing with relocation.")
+                
+                # One set_location per destination directory; the complete HDD copy is kept as-is
+                by_dest = {}
+                for hash_str, _, hdd_base_dir, _ in ready:
+                    by_dest.setdefault(hdd_base_dir, []).append(hash_str)
+                logger.info("Updating torrent location via qBittorrent API...")
+                for hdd_base_dir, hashes in by_dest.items():
+                    client.torrents_set_location(location=hdd_base_dir, torrent_hashes='|'.join(hashes))
+                settled = _wait_for_relocation(client, by_dest, RELOCATION_MOVE_TIMEOUT)
+                
+                for hash_str, torrent_info, hdd_base_dir, ssd_lstat in ready:
+                    if hash_str not in settled:
+                        logger.error(f"Torrent {hash_str} has not finished moving to '{hdd_base_dir}'. Keeping SSD data.")
+                        results[hash_str] = False
+                        continue
+                    delete_successful = _delete_ssd_data(torrent_info, download_path_ssd, ssd_lstat)
+                    # Update location tags if tagging is enabled
+                    if delete_successful:
+                        remove_ssd_tag(client, torrent_info.hash)
+                    results[hash_str] = delete_successful
+            finally:
+                # Back to seeding as soon as this group is done, not when the slowest group is
+                if to_pause:
+                    resume(to_pause)
+        
+        # One worker per destination device, so a single HDD never sees competing writers
+        by_device = {}
+        for item in targets.items():
+            by_device.setdefault(_device_of(item[1][1]), []).append(item)
+        workers = max(1, min(config.RELOCATE_PARALLELISM, len(by_device)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(relocate_group, items) for items in by_device.values()]:
+                future.result()
+    
     except Exception as e:
-        logger.error(f"qBittorrent API error during relocation of {torrent_info.hash}: {e}")
-        if was_started and "resume" not in str(e).lower():
-            try: 
-                logger.info("Attempting to resume torrent after error...")
-                client.torrents_resume(torrent_hashes=str(torrent_info.hash))
-            except Exception as restart_e: 
-                logger.error(f"Failed to send resume command after error: {restart_e}")
-        return False
+        logger.error(f"qBittorrent API error during relocation of {', '.join(targets)}: {e}")
+        for hash_str in targets:
+            results.setdefault(hash_str, False)
+    
+    finally:
+        # Restart torrents that were originally running and weren't resumed by their group
+        # (not paused yet, or their group's resume failed)
+        pending_resume = [h for h in was_started if h not in resumed]
+        if pending_resume and not resume(pending_resume):
+            for hash_str in pending_resume:
+                results[hash_str] = False
+    
+    return results
+
+def relocate_and_delete_ssd(client: 'QBittorrentClient', torrent_info: 'TorrentInfo', final_dest_base_hdd: str, download_path_ssd: str,
+                            initial_state: typing.Optional[str] = None):
+    """ Stops torrent, sets qBittorrent location to HDD path, deletes SSD copy, restarts. Uses qBittorrent API.
+    Pass initial_state (from an existing torrent listing) to skip the state lookup call."""
+    hash_str = str(torrent_info.hash)
+    initial_states = {hash_str: initial_state} if initial_state is not None else None
+    results = relocate_and_delete_ssd_batch(client, [torrent_info], final_dest_base_hdd, download_path_ssd, initial_states)
+    return results.get(hash_str, False)
 # ===================================================================
 
 # ===================================================================
@@ -273,15 +621,17 @@ def process_single_torrent_optimized(client: 'QBittorrentClient', torrent_info:
     category = torrent_info.category
 
     # 2. Construct Paths using config paths
-    hdd_base_dir = os.path.join(config.FINAL_DEST_BASE_HDD, category)
-    hdd_data_path = os.path.join(hdd_base_dir, torrent_info.name.strip())
+    hdd_base_dir, hdd_data_path = torrent_info.hdd_paths(config.FINAL_DEST_BASE_HDD)
     logger.info(f"Source SSD Path: {ssd_data_path}")
     logger.info(f"Target HDD Path: {hdd_data_path}")
     logger.info(f"Torrent Category: {category}")
-    logger.info(f"Multi-file: {is_multi} ({torrent_info.size / (1024**3):.2f} GB)")
+    logger.info("Multi-file: %s (%.2f GB)", is_multi, torrent_info.size / (1024**3))
 
     # 3. Pre-Copy Check: Handle existing destination from previous script run
-    if os.path.exists(hdd_data_path):
+    # (dest_present tracks whether hdd_data_path may exist, so later cleanups don't re-stat it).
+    # Dry runs skip it: verifying an existing copy would hash the whole payload for nothing.
+    dest_present = not config.DRY_RUN and os.path.exists(hdd_data_path)
+    if dest_present:
         logger.warning(f"Destination path '{hdd_data_path}' already exists.")
         # Call verify_copy from util
         if verify_copy(ssd_data_path, hdd_data_path, is_multi):
@@ -290,6 +640,7 @@ def process_single_torrent_optimized(client: 'QBittorrentClient', torrent_info:
         else:
             logger.warning("Existing destination failed verification. Attempting cleanup and fresh copy.")
             cleanup_destination(hdd_data_path) # Call cleanup from util
+            dest_present = False
 
     # 4. Copy & Verify Loop (if not already verified)
     if not copy_verified:
@@ -298,31 +649,51 @@ def process_single_torrent_optimized(client: 'QBittorrentClient', torrent_info:
         for attempt in range(1, max_attempts + 1):
             logger.info(f"Copy attempt {attempt}/{max_attempts}...")
 
+            # Back off before retrying (full jitter, so failing torrents don't retry in lockstep)
+            if attempt > 1 and not config.DRY_RUN:
+                delay = random.uniform(0, min(config.COPY_RETRY_MAX_DELAY,
+                                              config.COPY_RETRY_BASE_DELAY * 2 ** (attempt - 2)))
+                logger.info(f"Waiting {delay:.1f}s before retrying...")
+                time.sleep(delay)
+
             # Clean up destination from *previous failed attempt within this loop*
-            if attempt > 1 and os.path.exists(hdd_data_path):
+            if attempt > 1 and dest_present:
                  logger.info("Cleaning up destination from previous failed attempt...")
                  cleanup_destination(hdd_data_path) # Call cleanup from util
+                 dest_present = False
 
             # Attempt Copy
             copy_succeeded_this_attempt = False
+            src_digest = None
+            manifest = None
             try:
-                # Ensure base directory exists before copy
-                os.makedirs(hdd_base_dir, exist_ok=True)
                 copy_start_time = time.time()
                 
                 if config.DRY_RUN:
                     logger.info(f"[DRY RUN] Would copy {'directory' if is_multi else 'file'} from {ssd_data_path} to {hdd_data_path}")
                     copy_succeeded_this_attempt = True
                 else:
+                    # Ensure base directory exists before copy
+                    os.makedirs(hdd_base_dir, exist_ok=True)
+                    dest_present = True  # Even a failed copy may leave partial data behind
                     if is_multi:
-                        shutil.copytree(ssd_data_path, hdd_data_path, copy_function=shutil.copy2, dirs_exist_ok=True)
+                        # Record per-file checksums during the copy so verification skips the SSD
+                        manifest = {} if config.VERIFICATION_ENABLED else None
+                        parallel_copytree(ssd_data_path, hdd_data_path, workers=config.COPY_WORKERS, manifest=manifest)
                     else:
                         os.makedirs(os.path.dirname(hdd_data_path), exist_ok=True)
-                        shutil.copy2(ssd_data_path, hdd_data_path)
+                        if config.VERIFICATION_ENABLED:
+                            # Hash while copying so verification only has to re-read the HDD copy
+                            src_digest = copy_and_hash(ssd_data_path, hdd_data_path, buffer_size=config.COPY_BUFFER_SIZE)
+                        else:
+                            fastcopy(ssd_data_path, hdd_data_path)
                     logger.info(f"Copy finished in {time.time() - copy_start_time:.2f} seconds (Attempt {attempt}).")
                     copy_succeeded_this_attempt = True
             except (shutil.Error, OSError) as e:
                 logger.error(f"Error during copy (Attempt {attempt}): {e}")
+                if is_permanent_copy_error(e):
+                    logger.error("Error is not transient (e.g. disk full or permission denied). Not retrying.")
+                    break
 
             # Attempt Verification (only if copy didn't raise exception)
             if copy_succeeded_this_attempt:
@@ -331,7 +702,7 @@ def process_single_torrent_optimized(client: 'QBittorrentClient', torrent_info:
                     logger.info(f"[DRY RUN] Would verify copy integrity")
                     copy_verified = True; break
                 # Call verify_copy from util
-                elif verify_copy(ssd_data_path, hdd_data_path, is_multi):
+                elif verify_copy(ssd_data_path, hdd_data_path, is_multi, src_digest=src_digest, manifest=manifest):
                     copy_verified = True; break # Success! Exit loop.
                 else:
                     logger.warning(f"Verification failed on attempt {attempt}.") # Loop continues
@@ -345,25 +716,24 @@ def process_single_torrent_optimized(client: 'QBittorrentClient', torrent_info:
     if copy_verified:
         logger.info("Copy successful and verified. Notifying Arr service...")
         
-        # Add HDD location tag while keeping SSD tag (dual-location tracking)
-        add_hdd_tag(client, torrent_info.hash)
-        
-        service_to_notify = None
         # Determine which service to notify based on tag (using config tags)
-        if category.lower() == config.SONARR_TAG.lower(): service_to_notify = "sonarr"
-        elif category.lower() == config.RADARR_TAG.lower(): service_to_notify = "radarr"
-        else: logger.info(f"Tag '{category}' does not match Sonarr/Radarr tags. Skipping notification.")
+        service_to_notify = config.ARR_SERVICE_BY_CATEGORY.get(category.lower())
+        if service_to_notify is None:
+            logger.info(f"Tag '{category}' does not match Sonarr/Radarr tags. Skipping notification.")
 
-        # If a matching service was found, send the notification
+        # Queue the notification first so its HTTP round-trip overlaps the
+        # qBittorrent tag call below; each side logs its own failures
         if service_to_notify:
-            # Call notify_arr_scan_downloads, passing the config dict
             notify_arr_scan_downloads(service_to_notify, torrent_info.hash, config.ARR_CONFIG, hdd_data_path)
 
+        # Add HDD location tag while keeping SSD tag (dual-location tracking)
+        add_hdd_tag(client, torrent_info.hash)
+
         logger.info(f"--- Successfully processed (OPTIMIZED): {torrent_info.hash} ---")
         success = True
     else:
          logger.error(f"--- Failed processing (OPTIMIZED): {torrent_info.hash} ---")
-         if os.path.exists(hdd_data_path): cleanup_destination(hdd_data_path) # Final cleanup
+         if dest_present: cleanup_destination(hdd_data_path) # Final cleanup
          success = False
 
     logger.info(f"--- Finished optimized processing for {torrent_info.hash} in {time.time() - start_process_time:.2f} seconds ---")
@@ -378,7 +748,8 @@ def manage_ssd_space(client: 'QBittorrentClient'):
     """
     logger.info("--- Checking SSD Space and Managing Older Torrents ---")
     # Use get_available_space_gb from util, passing config path
-    available_gb = get_available_space_gb(config.DOWNLOAD_PATH_SSD)
+    # (a reading from the last few seconds is reused; it is invalidated after relocations)
+    available_gb = get_available_space_gb(config.DOWNLOAD_PATH_SSD, max_age=SPACE_CHECK_MAX_AGE)
     if available_gb is None: 
         logger.error("Could not check SSD space. Skipping management.")
         return
@@ -393,7 +764,7 @@ def manage_ssd_space(client: 'QBittorrentClient'):
     logger.warning(f"SSD space below threshold. Need to free up {space_needed:.2f} GB.")
     logger.info("Finding completed torrents residing on SSD for potential relocation via qBittorrent API...")
 
-    sorted_torrents_on_ssd = [] # List to hold info
+    sorted_torrents_on_ssd = [] # (timestamp, index, torrent) entries, oldest first once heapified
     try:
         # Efficiently get only completed torrents with SSD tag (if tagging is enabled)
         # This significantly reduces API overhead by filtering at the server level
@@ -405,89 +776,42 @@ def manage_ssd_space(client: 'QBittorrentClient'):
             
             # Filter to only include torrents that have BOTH SSD and HDD tags
             # These are torrents that exist on both locations and are candidates for SSD cleanup
-            dual_location_torrents = []
-            for torrent in ssd_torrents:
-                current_tags = getattr(torrent, 'tags', '') or ''
-                has_hdd_tag = config.HDD_LOCATION_TAG in current_tags
-                if has_hdd_tag:
-                    dual_location_torrents.append(torrent)
-            
-            ssd_torrents = dual_location_torrents
+            # (exact tag match - a substring test would also match e.g. 'hddqueued')
+            hdd_tag = config.HDD_LOCATION_TAG
+            ssd_torrents = [t for t in ssd_torrents if hdd_tag in parse_tags(t.get('tags'))]
             logger.info(f"Found {len(ssd_torrents)} completed torrents with both '{config.SSD_LOCATION_TAG}' and '{config.HDD_LOCATION_TAG}' tags (candidates for SSD cleanup)")
         else:
             # Fallback: get completed torrents and filter by path
             completed_torrents = get_torrents_by_status(client, 'completed')
+            ssd_prefix = config.DOWNLOAD_PATH_SSD
             ssd_torrents = [
                 t for t in completed_torrents 
-                if t.content_path and t.content_path.startswith(config.DOWNLOAD_PATH_SSD)
+                if (cp := t.get('content_path')) and cp.startswith(ssd_prefix)
             ]
             logger.info(f"Found {len(ssd_torrents)} completed torrents on SSD path (out of {len(completed_torrents)} total completed)")
 
-        for torrent in ssd_torrents:
-            try:
-                # Torrent is already known to be complete and on SSD (from filtering above)
-                torrent_path = torrent.content_path
-                
-                # Double-check path if not using tags (extra safety)
-                if not config.ENABLE_LOCATION_TAGGING and not (torrent_path and torrent_path.startswith(config.DOWNLOAD_PATH_SSD)):
-                    continue
-                # Get completion timestamp - qBittorrent uses 'completion_on' or calculate from last_activity
-                completed_timestamp = getattr(torrent, 'completion_on', None)
-                if not completed_timestamp:
-                    # Fallback: use last_activity or current time if not available
-                    completed_timestamp = getattr(torrent, 'last_activity', None)
-                    if not completed_timestamp:
-                        # Final fallback: assume completed recently
-                        completed_timestamp = int(time.time())
-                
-                # Convert to integer timestamp if it's not already
-                if isinstance(completed_timestamp, str):
-                    try:
-                        completed_timestamp = int(completed_timestamp)
-                    except ValueError:
-                        completed_timestamp = int(time.time())
-                
-                if completed_timestamp <= 0:
-                    logger.warning(f"Skipping torrent {torrent.hash} due to invalid completion timestamp")
-                    continue
-                
-                # Create TorrentInfo object for relocation function efficiently
-                # Determine if torrent is multi-file using proper qBittorrent API
+        now = int(time.time())
+        for index, torrent in enumerate(ssd_torrents):
+            # Torrent is already known to be complete and on SSD (from filtering above).
+            # TorrentDictionary is a dict: plain .get() avoids the AttrDict __getattr__ path
+            get = torrent.get
+            # Get completion timestamp - qBittorrent uses 'completion_on' or calculate from last_activity
+            # (fallback: assume completed recently)
+            completed_timestamp = get('completion_on') or get('last_activity') or now
+            
+            # Convert to integer timestamp if it's not already
+            if isinstance(completed_timestamp, str):
                 try:
-                    files_list = client.torrents_files(torrent_hash=torrent.hash)
-                    files_count = len(files_list)
-                except:
-                    # Fallback - assume single file if API call fails
-                    files_count = 1
-                
-                # Convert torrent object to dictionary for the factory method
-                torrent_dict = {
-                    'hash': torrent.hash,
-                    'name': torrent.name,
-                    'content_path': getattr(torrent, 'content_path', ''),
-                    'save_path': getattr(torrent, 'save_path', ''),
-                    'root_path': getattr(torrent, 'root_path', ''),
-                    'size': getattr(torrent, 'size', 0),
-                    'category': getattr(torrent, 'category', '') or '',
-                    'tags': getattr(torrent, 'tags', ''),
-                    'tracker': getattr(torrent, 'tracker', ''),
-                }
-                
-                # Create TorrentInfo using the factory method
-                torrent_info = TorrentInfo.from_qbittorrent_api(torrent_dict, files_count)
-                info = {
-                    "torrent_info": torrent_info,
-                    "size": torrent.size/(1024**3),
-                    "timestamp": completed_timestamp
-                }
-                sorted_torrents_on_ssd.append(info)
-            except AttributeError as e: 
-                logger.warning(f"Attribute error processing torrent {getattr(torrent, 'hash', 'UNKNOWN')}: {e}")
-            except Exception as e: 
-                logger.warning(f"Unexpected error processing torrent {getattr(torrent, 'hash', 'UNKNOWN')}: {e}")
-
-        # Sort the collected list by timestamp (oldest first)
-        sorted_torrents_on_ssd = sorted(sorted_torrents_on_ssd, key=lambda x: x['timestamp'])
+                    completed_timestamp = int(completed_timestamp)
+                except ValueError:
+                    completed_timestamp = now
+            
+            if completed_timestamp <= 0:
+                logger.warning(f"Skipping torrent {get('hash')} due to invalid completion timestamp")
+                continue
+            
+            # The index breaks timestamp ties so torrents themselves are never compared
+            sorted_torrents_on_ssd.append((completed_timestamp, index, torrent))
 
     except Exception as e: 
         logger.error(f"Failed to get list of torrents for space management: {e}")
@@ -498,18 +822,49 @@ def manage_ssd_space(client: 'QBittorrentClient'):
         return
     logger.info(f"Found {len(sorted_torrents_on_ssd)} completed torrent(s) on SSD to consider for relocation (oldest first).")
 
-    # Relocate Oldest Torrents until Space Threshold is Met
+    # Pick the oldest torrents until the space threshold would be met. A heap
+    # only orders as many torrents as get popped, instead of sorting the library.
+    heapq.heapify(sorted_torrents_on_ssd)
+    victim_torrents = []; planned_gb = 0
+    while sorted_torrents_on_ssd and planned_gb < space_needed:
+        completed_timestamp, _, torrent = heapq.heappop(sorted_torrents_on_ssd)
+        victim_torrents.append((completed_timestamp, torrent))
+        planned_gb += (torrent.get('size') or 0) / (1024**3)
+    
+    # TorrentInfo objects (and any file-list calls older qBittorrent versions
+    # need) are only built for the torrents actually being relocated
+    files_counts = get_files_counts(client, [torrent for _, torrent in victim_torrents])
+    victims = []
+    for completed_timestamp, torrent in victim_torrents:
+        try:
+            # The listing already uses the API key names, so it goes to the factory as-is
+            torrent_info = TorrentInfo.from_qbittorrent_api(torrent, files_counts.get(torrent.get('hash'), 1))
+            victims.append({
+                "torrent_info": torrent_info,
+                "size": torrent_info.size/(1024**3),
+                "timestamp": completed_timestamp,
+                "state": torrent.get('state')
+            })
+        except Exception as e: 
+            logger.warning(f"Unexpected error processing torrent {torrent.get('hash', 'UNKNOWN')}: {e}")
+    
+    # Relocate them together (batched pause/set_location/resume)
+    # States from the listing above save a torrents_info round trip
+    initial_states = {str(info["torrent_info"].hash): info["state"] for info in victims if info["state"]}
+    results = relocate_and_delete_ssd_batch(
+        client, [info["torrent_info"] for info in victims], config.FINAL_DEST_BASE_HDD, config.DOWNLOAD_PATH_SSD,
+        initial_states
+    )
+    if results:
+        invalidate_space_cache(config.DOWNLOAD_PATH_SSD)
     space_freed_gb = 0; relocated_count = 0
-    for info in sorted_torrents_on_ssd:
-        if space_freed_gb >= space_needed: 
-            logger.info(f"Successfully freed {space_freed_gb:.2f} GB.")
-            break
-        # Call the relocation function, passing TorrentInfo object
-        if relocate_and_delete_ssd(client, info["torrent_info"], config.FINAL_DEST_BASE_HDD, config.DOWNLOAD_PATH_SSD):
+    for info in victims:
+        if results.get(str(info["torrent_info"].hash)):
             space_freed_gb += info["size"]; relocated_count += 1
         else: 
-            logger.error(f"Stopping relocation process due to failure on {info['torrent_info'].hash}.")
-            break
+            logger.error(f"Relocation failed for {info['torrent_info'].hash}.")
+    if space_freed_gb >= space_needed:
+        logger.info(f"Successfully freed {space_freed_gb:.2f} GB.")
 
     logger.info(f"Space Management Summary: Relocated {relocated_count} older torrent(s), freeing approx {space_freed_gb:.2f} GB.")
     final_available_space = available_gb + space_freed_gb
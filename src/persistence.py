@@ -6,13 +6,21 @@ This module handles saving and restoring orchestrator state during graceful shut
 to ensure no work is lost when the container is restarted.
 """
 
+import functools
+import heapq
 import json
 import os
 import time
 from typing import Dict, List, Optional, Any
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
+# Optional fast JSON encoder/decoder (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import logging
 try:
     from logger import setup_logging
@@ -58,12 +66,59 @@ class ServiceState:
 # Persistence Functions
 # ===================================================================
 
+def _dump_state(state_dict) -> bytes:
+    """Serialize the state file contents as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(state_dict, option=orjson.OPT_INDENT_2)
+    return json.dumps(state_dict, indent=2).encode('utf-8')
+
+def _write_file_durably(path: str, payload: bytes):
+    """
+    Atomically replace path with payload, surviving a crash right after shutdown.
+
+    The data is written to a temp file with a single unbuffered write and
+    fsynced before the rename, so the rename can never expose an empty or
+    torn file; the directory is then fsynced so the rename itself persists.
+    """
+    temp_file = f"{path}.tmp"
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    
+    # Atomic move to avoid corruption
+    os.replace(temp_file, path)
+    try:
+        dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError as e:
+        # Not supported everywhere; the file contents are already durable
+        logger.debug(f"Could not fsync state directory: {e}")
+
+def _load_state(data: bytes):
+    """Parse state file contents written by _dump_state."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=None)
+def _state_file_path_for(lock_dir: str) -> str:
+    """Create the state directory under lock_dir (once per process) and return the file path."""
+    state_dir = os.path.join(lock_dir, 'state')
+    os.makedirs(state_dir, exist_ok=True)
+    return os.path.join(state_dir, 'orchestrator_state.json')
+
 def get_state_file_path():
     """Get the path for the state persistence file"""
     import config
-    state_dir = os.path.join(config.LOCK_DIR, 'state')
-    os.makedirs(state_dir, exist_ok=True)
-    return os.path.join(state_dir, 'orchestrator_state.json')
+    return _state_file_path_for(config.LOCK_DIR)
 
 def save_orchestrator_state(orchestrator):
     """
@@ -76,7 +131,7 @@ def save_orchestrator_state(orchestrator):
         with orchestrator.lock:
             # Convert queue items to serializable format
             queue_items = []
-            for item in orchestrator.process_queue:
+            for _, item in orchestrator.process_queue:
                 persisted_item = PersistedQueueItem(
                     id=item.id,
                     torrent_data=item.torrent.to_dict(),  # Serialize TorrentInfo
@@ -109,23 +164,19 @@ def save_orchestrator_state(orchestrator):
                 shutdown_time=time.time()
             )
             
-            # Save to file
-            state_file = get_state_file_path()
-            temp_file = f"{state_file}.tmp"
-            
-            with open(temp_file, 'w') as f:
-                # Convert dataclasses to dict for JSON serialization
-                state_dict = {
-                    'queue_items': [asdict(item) for item in state.queue_items],
-                    'running_processes': [asdict(proc) for proc in state.running_processes],
-                    'statistics': state.statistics,
-                    'shutdown_time': state.shutdown_time,
-                    'version': state.version
-                }
-                json.dump(state_dict, f, indent=2)
+            # Convert dataclasses to dict for JSON serialization. Their fields are
+            # flat (torrent_data/result are already plain dicts), so the instance
+            # __dict__ is enough; asdict() would deep-copy every value first.
+            state_dict = {
+                'queue_items': [item.__dict__ for item in state.queue_items],
+                'running_processes': [proc.__dict__ for proc in state.running_processes],
+                'statistics': state.statistics,
+                'shutdown_time': state.shutdown_time,
+                'version': state.version
+            }
             
-            # Atomic move to avoid corruption
-            os.replace(temp_file, state_file)
+            # Save to file
+            _write_file_durably(get_state_file_path(), _dump_state(state_dict))
             
             logger.info(f"Saved orchestrator state: {len(queue_items)} queued, {len(running_processes)} running")
             return True
@@ -148,8 +199,8 @@ def load_orchestrator_state():
         return None
     
     try:
-        with open(state_file, 'r') as f:
-            state_dict = json.load(f)
+        with open(state_file, 'rb') as f:
+            state_dict = _load_state(f.read())
         
         # Validate version compatibility
         version = state_dict.get('version', '1.0')
@@ -217,7 +268,7 @@ def restore_orchestrator_state(orchestrator, state):
                     queued_time=persisted_item.queued_time,
                     priority=persisted_item.priority
                 )
-                orchestrator.process_queue.append(queue_item)
+                heapq.heappush(orchestrator.process_queue, (queue_item.as_heap_key(), queue_item))
             
             # Re-queue interrupted running processes
             # These were running when the service shut down, so we need to restart them
@@ -233,10 +284,7 @@ def restore_orchestrator_state(orchestrator, state):
                     queued_time=time.time(),  # Current time for restored items
                     priority=10  # Higher priority for interrupted processes
                 )
-                orchestrator.process_queue.append(queue_item)
-            
-            # Sort queue by priority and time
-            orchestrator.process_queue.sort(key=lambda x: (-x.priority, x.queued_time))
+                heapq.heappush(orchestrator.process_queue, (queue_item.as_heap_key(), queue_item))
             
             # Restore relevant statistics (but update timestamps)
             if state.statistics:
@@ -3,6 +3,7 @@
 import os
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 # Import classes
 from classes import BTIH, TorrentInfo, TimeoutError
@@ -30,6 +31,10 @@ if typing.TYPE_CHECKING:
 # Global client instance for singleton pattern
 _qbit_client_instance = None
 _client_lock = None
+# time.monotonic() of the last successful call proving the singleton works
+_qbit_client_last_ok = 0.0
+# Skip the health-check probe if the client was confirmed working this recently (seconds)
+_CLIENT_HEALTH_TTL = 30.0
 
 def get_qbit_client():
     """
@@ -44,7 +49,7 @@ def get_qbit_client():
     Raises:
         ConnectionError: If unable to connect or authenticate
     """
-    global _qbit_client_instance, _client_lock
+    global _qbit_client_instance, _client_lock, _qbit_client_last_ok
     import config
     import qbittorrentapi
     
@@ -56,15 +61,20 @@ def get_qbit_client():
     with _client_lock:
         # Return existing instance if available and healthy
         if _qbit_client_instance is not None:
+            if time.monotonic() - _qbit_client_last_ok < _CLIENT_HEALTH_TTL:
+                # Recently verified; the client re-authenticates by itself if the session expired
+                return _qbit_client_instance
             try:
                 # Test connection by making a lightweight API call
                 _qbit_client_instance.app.version
+                _qbit_client_last_ok = time.monotonic()
                 logger.debug("Reusing existing qBittorrent client connection")
                 return _qbit_client_instance
             except Exception as e:
                 logger.warning(f"Existing qBittorrent client connection failed: {e}")
                 logger.info("Creating new qBittorrent client connection...")
                 _qbit_client_instance = None
+                _qbit_client_last_ok = 0.0
         
         # Create new client instance
         logger.debug("Creating new qBittorrent client connection...")
@@ -77,6 +87,12 @@ def get_qbit_client():
             'REQUESTS_ARGS': {
                 'timeout': 30,  # 30 second timeout
                 'allow_redirects': True
+            },
+            # The singleton is shared by the orchestrator's worker threads;
+            # size the keep-alive pool so they don't open throwaway connections
+            'HTTPADAPTER_ARGS': {
+                'pool_connections': 4,
+                'pool_maxsize': 16
             }
         })
         
@@ -91,6 +107,7 @@ def get_qbit_client():
             
             # Store the working client
             _qbit_client_instance = client
+            _qbit_client_last_ok = time.monotonic()
             return _qbit_client_instance
             
         except qbittorrentapi.LoginFailed as e:
@@ -107,7 +124,7 @@ def close_qbit_client():
     This should be called when the application is shutting down to properly
     clean up the session in qBittorrent.
     """
-    global _qbit_client_instance, _client_lock
+    global _qbit_client_instance, _client_lock, _qbit_client_last_ok
     
     if _client_lock is None:
         return
@@ -121,6 +138,7 @@ def close_qbit_client():
                 logger.warning(f"Error logging out from qBittorrent: {e}")
             finally:
                 _qbit_client_instance = None
+                _qbit_client_last_ok = 0.0
 
 # ===================================================================
 # qBittorrent API Functions
@@ -139,15 +157,18 @@ def get_torrent_info(client: 'QBittorrentClient', hash_val: BTIH, wait_for_stabi
     """
     logger.debug("Getting torrent info...")
     
-    # Add initial delay to let torrent state stabilize if requested
+    # Let torrent state stabilize if requested: poll until it has settled, up to the old fixed delay
     if wait_for_stability:
         stability_delay = 3  # seconds
-        logger.info(f"Waiting {stability_delay}s for torrent state to stabilize...")
-        time.sleep(stability_delay)
+        logger.info(f"Waiting up to {stability_delay}s for torrent state to stabilize...")
+        if not wait_for_torrent(client, hash_val, _is_settled, timeout=stability_delay, interval=0.25):
+            logger.debug(f"Torrent {hash_val} still not settled after {stability_delay}s, continuing.")
     
     try:
         with timeout_context(30):  # 30 second timeout for getting torrent info
-            torrents = client.torrents_info(torrent_hashes=str(hash_val))
+            # Plain dicts: the fields are copied straight into TorrentInfo, so the
+            # TorrentDictionary wrapping would be thrown away immediately
+            torrents = client.torrents_info(torrent_hashes=str(hash_val), SIMPLE_RESPONSES=True)
             
             if not torrents:
                 logger.error(f"Torrent {hash_val} not found.")
@@ -158,26 +179,14 @@ def get_torrent_info(client: 'QBittorrentClient', hash_val: BTIH, wait_for_stabi
             
             # Determine if torrent is multi-file using proper qBittorrent API
             try:
-                files_list = client.torrents_files(torrent_hash=torrent.hash)
+                files_list = client.torrents_files(torrent_hash=torrent['hash'], SIMPLE_RESPONSES=True)
                 files_count = len(files_list)
             except:
                 # Fallback - assume single file if API call fails
                 files_count = 1
             
-            # Convert torrent object to dictionary for the factory method
-            torrent_dict = {
-                'hash': torrent.hash,
-                'name': torrent.name,
-                'content_path': torrent.content_path,
-                'save_path': getattr(torrent, 'save_path', ''),
-                'size': torrent.size,
-                'category': torrent.category or '',
-                'tags': getattr(torrent, 'tags', []),
-                'tracker': getattr(torrent, 'tracker', ''),
-            }
-            
-            # Create TorrentInfo using the factory method
-            torrent_info = TorrentInfo.from_qbittorrent_api(torrent_dict, files_count)
+            # The API dict is already in the shape the factory method reads
+            torrent_info = TorrentInfo.from_qbittorrent_api(torrent, files_count)
             logger.debug(f"Successfully retrieved info for torrent: {torrent_info.name}")
             return torrent_info
             
@@ -197,28 +206,16 @@ def get_torrents_by_path(client: 'QBittorrentClient', path: str, complete=True)
     param complete: If True, only include torrents that are complete.
     return: A list of TorrentDictionary for torrents that match the given criteria.
     """
-    logger.debug(f"Getting torrents by path: {path}")
+    logger.debug("Getting torrents by path: %s", path)
     # QBittorrent doesn't have a direct "realpath" field in torrent_info,
-    # so we'll search by path and then filter by completion status.
-    # This is a simplified approach and might not be perfectly accurate
-    # if multiple torrents have the same path but different completion status.
-    
-    # Fetch all torrents
-    all_torrents = get_all_torrents(client)
-    
-    # Filter by path
-    matching_torrents = [
-        t for t in all_torrents if t.content_path == path
-    ]
+    # so we'll search by path. Completion is filtered server-side, so only
+    # finished torrents are transferred and parsed when complete=True.
+    torrents = get_torrents_by_status(client, 'completed') if complete else get_all_torrents(client)
     
-    # Optionally filter by completion status
-    if complete:
-        # In qBittorrent, check if torrent is complete by checking progress
-        matching_torrents = [
-            t for t in matching_torrents if t.progress == 1.0  # 1.0 = 100% complete
-        ]
+    # Single pass; item access avoids TorrentDictionary's attribute lookup
+    matching_torrents = [t for t in torrents if t.get('content_path') == path]
     
-    logger.debug(f"Found {len(matching_torrents)} matches")
+    logger.debug("Found %d matches", len(matching_torrents))
     return matching_torrents
 
 def get_all_torrents(client: 'QBittorrentClient') -> typing.List['TorrentDictionary']:
@@ -249,7 +246,7 @@ def get_torrents_by_tag(client: 'QBittorrentClient', tag: str) -> typing.List['T
     Returns:
         List of TorrentDictionary objects matching the tag
     """
-    logger.debug(f"Getting torrents with tag: {tag}")
+    logger.debug("Getting torrents with tag: %s", tag)
     try:
         return client.torrents_info(tag=tag)
     except Exception as e:
@@ -267,7 +264,7 @@ def get_torrents_by_status(client: 'QBittorrentClient', status: str) -> typing.L
     Returns:
         List of TorrentDictionary objects matching the status
     """
-    logger.debug(f"Getting torrents with status: {status}")
+    logger.debug("Getting torrents with status: %s", status)
     try:
         return client.torrents_info(status_filter=status)
     except Exception as e:
@@ -286,33 +283,136 @@ def get_torrents_by_status_and_tag(client: 'QBittorrentClient', status: str, tag
     Returns:
         List of TorrentDictionary objects matching both status and tag
     """
-    logger.debug(f"Getting torrents with status '{status}' and tag '{tag}'")
+    logger.debug("Getting torrents with status '%s' and tag '%s'", status, tag)
     try:
         return client.torrents_info(status_filter=status, tag=tag)
     except Exception as e:
         logger.error(f"Failed to get torrents by status '{status}' and tag '{tag}': {e}")
         raise
 
-def get_torrent_by_hash(client: 'QBittorrentClient', hash_val: str) -> 'TorrentDictionary':
+def _files_count_from_paths(torrent: 'TorrentDictionary') -> typing.Optional[int]:
     """
-    Get a specific torrent by its hash (lightweight version that returns raw torrent object).
+    Infer single/multi-file from a torrents_info listing's paths, or None if they don't tell.
+
+    content_path is the torrent's top-level folder for a multi-file torrent:
+    equal to root_path ("Original"/"Create subfolder" layout) or to save_path
+    ("Don't create subfolder" layout). A single-file torrent's content_path is
+    the file itself, directly in save_path (root_path empty) or inside the
+    subfolder root_path ("Create subfolder" layout). Multi-file returns 2 as
+    a lower bound, since callers only need the single/multi distinction.
+    """
+    root_path = torrent.get('root_path')
+    content_path = (torrent.get('content_path') or '').rstrip('/')
+    if root_path is None or not content_path:
+        # Older qBittorrent without root_path
+        return None
+    root_path = root_path.rstrip('/')
+    save_path = (torrent.get('save_path') or '').rstrip('/')
+    if content_path == root_path or content_path == save_path:
+        return 2
+    if not root_path or content_path.startswith(root_path + '/'):
+        return 1
+    return None
+
+def get_files_count(client: 'QBittorrentClient', torrent: 'TorrentDictionary') -> int:
+    """
+    Get a torrent's file count for TorrentInfo, avoiding a torrents_files call when possible.
+
+    The listing's paths usually decide it (see _files_count_from_paths); only
+    listings they don't settle, e.g. from older qBittorrent without
+    root_path, fall back to one torrents_files call.
     
     Args:
         client: qBittorrent client instance
-        hash_val: Hash of the torrent to retrieve
+        torrent: Torrent object from a torrents_info listing
         
     Returns:
-        TorrentDictionary object for the specified torrent
-        
-    Raises:
-        ValueError: If torrent not found
+        int: 1 for single-file torrents, >1 for multi-file torrents
     """
-    logger.debug(f"Getting torrent by hash: {hash_val}")
+    count = _files_count_from_paths(torrent)
+    if count is not None:
+        return count
+    
     try:
-        torrents = client.torrents_info(torrent_hashes=str(hash_val))
-        if not torrents:
-            raise ValueError(f"Torrent {hash_val} not found")
-        return torrents[0]
-    except Exception as e:
-        logger.error(f"Failed to get torrent by hash '{hash_val}': {e}")
-        raise 
\ No newline at end of file
+        return len(client.torrents_files(torrent_hash=torrent.get('hash')))
+    except Exception:
+        # Fallback - assume single file if API call fails
+        return 1
+
+def get_files_counts(client: 'QBittorrentClient', torrents: typing.Iterable['TorrentDictionary'],
+                     max_workers: int = 8) -> typing.Dict[str, int]:
+    """
+    Batch version of get_files_count, keyed by torrent hash.
+    
+    Torrents whose listing paths settle it are resolved locally; the
+    remaining torrents_files calls (e.g. for older qBittorrent versions) are
+    issued concurrently so their round-trips overlap instead of adding up.
+    
+    Args:
+        client: qBittorrent client instance
+        torrents: Torrent objects from a torrents_info listing
+        max_workers: Maximum concurrent torrents_files requests
+        
+    Returns:
+        dict: Maps torrent hash to file count (see get_files_count)
+    """
+    counts = {}
+    pending = []
+    for torrent in torrents:
+        count = _files_count_from_paths(torrent)
+        if count is not None:
+            counts[torrent.get('hash')] = count
+        else:
+            pending.append(torrent)
+    
+    if pending:
+        logger.debug("Fetching file lists for %s torrent(s)", len(pending))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for torrent, count in zip(pending, executor.map(lambda t: get_files_count(client, t), pending)):
+                counts[torrent.get('hash')] = count
+    return counts
+
+# qBittorrent 4.x reports paused torrents as paused*, 5.x as stopped*
+PAUSED_STATES = frozenset(('pausedDL', 'pausedUP', 'stoppedDL', 'stoppedUP'))
+
+# States in which files are still being checked, moved or allocated
+TRANSIENT_STATES = frozenset(('checkingDL', 'checkingUP', 'checkingResumeData', 'moving', 'metaDL', 'allocating'))
+
+def _is_settled(torrent) -> bool:
+    """True once a torrent has finished downloading and isn't checking/moving its files."""
+    return torrent.get('progress', 0) >= 1 and torrent.get('state') not in TRANSIENT_STATES
+
+def wait_for_torrents(client: 'QBittorrentClient', hashes: typing.Iterable[str], predicate: typing.Callable[['TorrentDictionary'], bool],
+                      timeout: float = 5.0, interval: float = 0.05) -> bool:
+    """
+    Poll torrents until predicate(torrent) is true for all of them, instead of sleeping a fixed time.
+    
+    Args:
+        client: qBittorrent client instance
+        hashes: Hashes of the torrents to poll
+        predicate: Called with each current torrent object
+        timeout: Maximum time to wait in seconds
+        interval: Delay between polls in seconds
+        
+    Returns:
+        bool: True if the predicate was met for every torrent, False on timeout
+    """
+    hashes = [str(h) for h in hashes]
+    joined = '|'.join(hashes)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            torrents = client.torrents_info(torrent_hashes=joined)
+            if len(torrents) == len(hashes) and all(predicate(t) for t in torrents):
+                return True
+        except Exception as e:
+            logger.debug("Error polling torrents %s: %s", joined, e)
+        if time.monotonic() >= deadline:
+            logger.debug("Timed out after %ss waiting for torrents %s", timeout, joined)
+            return False
+        time.sleep(interval)
+
+def wait_for_torrent(client: 'QBittorrentClient', hash_val: str, predicate: typing.Callable[['TorrentDictionary'], bool],
+                     timeout: float = 5.0, interval: float = 0.05) -> bool:
+    """Poll a single torrent until predicate(torrent) is true (see wait_for_torrents)."""
+    return wait_for_torrents(client, [hash_val], predicate, timeout, interval)
@@ -8,10 +8,11 @@ system with a centralized in-memory orchestrator.
 """
 
 import asyncio
+import heapq
 import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 import signal
@@ -27,7 +28,10 @@ except ImportError:
 
 # Import our modules
 import config
-from classes import BTIH, TorrentInfo, ServiceStatus, ProcessInfo, QueueItem
+from classes import (
+    BTIH, TorrentInfo, ProcessInfo, QueueItem,
+    STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
+)
 from qbit import get_qbit_client
 from tasks import process_torrent_unified
 from core import manage_ssd_space
@@ -54,7 +58,7 @@ class QbitManagerOrchestrator:
     
     def __init__(self):
         self.processes: Dict[str, ProcessInfo] = {}  # Contains both running and completed processes (last 10 completed kept for monitoring)
-        self.process_queue: List[QueueItem] = []
+        self.process_queue: List[Tuple[tuple, QueueItem]] = []  # heapq of (QueueItem.as_heap_key(), QueueItem)
         # Add copy operation tracking
         self.running_copy_operations: Dict[str, Dict] = {}
         self.copy_queue: List[Dict] = []
@@ -110,9 +114,8 @@ class QbitManagerOrchestrator:
                 queued_time=time.time(),
                 priority=priority
             )
-            self.process_queue.append(item)
-            # Sort by priority (higher first), then by time (older first)
-            self.process_queue.sort(key=lambda x: (-x.priority, x.queued_time))
+            # Heap ordered by priority (higher first), then by time (older first)
+            heapq.heappush(self.process_queue, (item.as_heap_key(), item))
             
             logger.info(f"Added torrent {torrent_hash} to queue with ID {queue_id}")
             self._process_queue()
@@ -122,11 +125,11 @@ class QbitManagerOrchestrator:
         """Process items from the queue if capacity is available"""
         with self.lock:
             # Only count actually running processes for concurrency limit
-            running_count = len([p for p in self.processes.values() if p.status == ServiceStatus.RUNNING])
+            running_count = len([p for p in self.processes.values() if p.status == STATUS_RUNNING])
             while (running_count < config.MAX_CONCURRENT_PROCESSES 
                    and self.process_queue):
                 
-                item = self.process_queue.pop(0)
+                _, item = heapq.heappop(self.process_queue)
                 self._start_torrent_processing(item)
                 running_count += 1
             
@@ -141,7 +144,7 @@ class QbitManagerOrchestrator:
             id=process_id,
             torrent_hash=str(queue_item.torrent.hash),  # Use hash from TorrentInfo
             start_time=time.time(),
-            status=ServiceStatus.RUNNING
+            status=STATUS_RUNNING
         )
         
         self.processes[process_id] = process_info
@@ -181,7 +184,7 @@ class QbitManagerOrchestrator:
             
             try:
                 result = future.result()
-                process_info.status = ServiceStatus.COMPLETED if result['success'] else ServiceStatus.FAILED
+                process_info.status = STATUS_COMPLETED if result['success'] else STATUS_FAILED
                 process_info.result = result
                 process_info.end_time = time.time()
                 process_info.duration = process_info.end_time - process_info.start_time
@@ -193,7 +196,7 @@ class QbitManagerOrchestrator:
                     logger.error(f"Torrent processing failed: {result.get('torrent_hash', 'unknown')}")
                     
             except Exception as e:
-                process_info.status = ServiceStatus.FAILED
+                process_info.status = STATUS_FAILED
                 process_info.result = {'success': False, 'error': str(e)}
                 process_info.end_time = time.time()
                 process_info.duration = process_info.end_time - process_info.start_time
@@ -201,7 +204,7 @@ class QbitManagerOrchestrator:
             
             # Clean up old completed processes (keep last 10 for monitoring/debugging)
             completed_processes = [p for p in self.processes.values() 
-                                 if p.status in [ServiceStatus.COMPLETED, ServiceStatus.FAILED]]
+                                 if p.status in [STATUS_COMPLETED, STATUS_FAILED]]
             if len(completed_processes) > 10:
                 oldest_completed = sorted(completed_processes, key=lambda x: x.start_time)[:-10]
                 for old_process in oldest_completed:
@@ -270,7 +273,7 @@ class QbitManagerOrchestrator:
             'torrent_hash': copy_item['hash'],
             'torrent_name': copy_item['name'],
             'start_time': time.time(),
-            'status': ServiceStatus.RUNNING,
+            'status': STATUS_RUNNING,
             'ssd_path': copy_item['ssd_path'],
             'hdd_path': copy_item['hdd_path'],
             'size': copy_item.get('size', 0)
@@ -286,7 +289,7 @@ class QbitManagerOrchestrator:
         """Worker function that runs copy operations in a background thread"""
         import shutil
         import os
-        from util import verify_copy
+        from util import verify_copy, parallel_copytree
         
         # Set process priority to lower CPU usage (if supported)
         try:
@@ -312,9 +315,8 @@ class QbitManagerOrchestrator:
             copy_start_time = time.time()
             
             if is_multi_file:
-                # Use optimized copy function for directories
-                shutil.copytree(copy_item['ssd_path'], copy_item['hdd_path'], 
-                              copy_function=self._optimized_copy_file, dirs_exist_ok=True)
+                # Copy the directory's files in parallel (each via the in-kernel fast path)
+                parallel_copytree(copy_item['ssd_path'], copy_item['hdd_path'], workers=config.COPY_WORKERS)
             else:
                 # Use optimized copy for single files
                 self._optimized_copy_file(copy_item['ssd_path'], copy_item['hdd_path'])
@@ -367,22 +369,11 @@ class QbitManagerOrchestrator:
             }
     
     def _optimized_copy_file(self, src: str, dst: str):
-        """Optimized file copy with configurable buffer size"""
-        import shutil
-        
-        # Use larger buffer size for better I/O performance
-        buffer_size = config.COPY_BUFFER_SIZE
+        """Optimized file copy (in-kernel where possible, configurable fallback buffer size)"""
+        from util import fastcopy
         
-        # Copy file with optimized buffer size
-        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
-            while True:
-                buf = fsrc.read(buffer_size)
-                if not buf:
-                    break
-                fdst.write(buf)
-        
-        # Copy metadata (timestamps, permissions)
-        shutil.copystat(src, dst)
+        # fastcopy also copies metadata (timestamps, permissions)
+        return fastcopy(src, dst, buffer_size=config.COPY_BUFFER_SIZE)
     
     def _on_copy_complete(self, copy_id: str, future):
         """Callback when a copy operation completes"""
@@ -394,7 +385,7 @@ class QbitManagerOrchestrator:
             
             try:
                 result = future.result()
-                copy_info['status'] = ServiceStatus.COMPLETED if result['success'] else ServiceStatus.FAILED
+                copy_info['status'] = STATUS_COMPLETED if result['success'] else STATUS_FAILED
                 copy_info['result'] = result
                 copy_info['end_time'] = time.time()
                 copy_info['duration'] = copy_info['end_time'] - copy_info['start_time']
@@ -407,7 +398,7 @@ class QbitManagerOrchestrator:
                     logger.error(f"Copy operation failed: {result.get('torrent_name', 'unknown')}")
                     
             except Exception as e:
-                copy_info['status'] = ServiceStatus.FAILED
+                copy_info['status'] = STATUS_FAILED
                 copy_info['result'] = {'success': False, 'error': str(e)}
                 copy_info['end_time'] = time.time()
                 copy_info['duration'] = copy_info['end_time'] - copy_info['start_time']
@@ -416,7 +407,7 @@ class QbitManagerOrchestrator:
             
             # Clean up old completed copy operations (keep last 20)
             completed_copies = [p for p in self.running_copy_operations.values() 
-                              if p['status'] in [ServiceStatus.COMPLETED, ServiceStatus.FAILED]]
+                              if p['status'] in [STATUS_COMPLETED, STATUS_FAILED]]
             if len(completed_copies) > 20:
                 oldest_completed = sorted(completed_copies, key=lambda x: x['start_time'])[:-20]
                 for old_copy in oldest_completed:
@@ -441,9 +432,9 @@ class QbitManagerOrchestrator:
             
             return {
                 'batch_id': batch_id,
-                'running_operations': len([op for op in operations if op['status'] == ServiceStatus.RUNNING]),
-                'completed_operations': len([op for op in operations if op['status'] == ServiceStatus.COMPLETED]),
-                'failed_operations': len([op for op in operations if op['status'] == ServiceStatus.FAILED]),
+                'running_operations': len([op for op in operations if op['status'] == STATUS_RUNNING]),
+                'completed_operations': len([op for op in operations if op['status'] == STATUS_COMPLETED]),
+                'failed_operations': len([op for op in operations if op['status'] == STATUS_FAILED]),
                 'queued_operations': len(queue_items),
                 'operations': [
                     {
@@ -451,7 +442,7 @@ class QbitManagerOrchestrator:
                         'batch_id': op.get('batch_id'),
                         'torrent_hash': op['torrent_hash'],
                         'torrent_name': op['torrent_name'],
-                        'status': op['status'].value,
+                        'status': op['status'],
                         'start_time': datetime.fromtimestamp(op['start_time']).isoformat(),
                         'duration_seconds': op.get('duration', time.time() - op['start_time']),
                         'size_gb': f"{op.get('size', 0) / (1024**3):.2f}" if op.get('size') else "Unknown"
@@ -468,17 +459,17 @@ class QbitManagerOrchestrator:
             
             return {
                 'service': {
-                    'status': ServiceStatus.RUNNING.value,
+                    'status': STATUS_RUNNING,
                     'uptime_seconds': uptime,
                     'uptime_human': f"{uptime/3600:.1f} hours",
                     'last_activity': datetime.fromtimestamp(self.stats['last_activity']).isoformat()
                 },
                 'processing': {
-                    'running_processes': len([p for p in self.processes.values() if p.status == ServiceStatus.RUNNING]),
+                    'running_processes': len([p for p in self.processes.values() if p.status == STATUS_RUNNING]),
                     'total_processes': len(self.processes),
                     'max_concurrent': config.MAX_CONCURRENT_PROCESSES,
                     'queue_size': len(self.process_queue),
-                    'capacity_available': config.MAX_CONCURRENT_PROCESSES - len([p for p in self.processes.values() if p.status == ServiceStatus.RUNNING])
+                    'capacity_available': config.MAX_CONCURRENT_PROCESSES - len([p for p in self.processes.values() if p.status == STATUS_RUNNING])
                 },
                 'copy_operations': {
                     'running_copies': len(self.running_copy_operations),
@@ -491,7 +482,7 @@ class QbitManagerOrchestrator:
                     {
                         'id': p.id,
                         'torrent_hash': p.torrent_hash,
-                        'status': p.status.value,
+                        'status': p.status,
                         'start_time': datetime.fromtimestamp(p.start_time).isoformat(),
                         'duration_seconds': p.duration if p.duration is not None else (time.time() - p.start_time)
                     }
@@ -522,8 +513,8 @@ class QbitManagerOrchestrator:
             self._save_current_state()
         
         # Wait for running processes to complete (with timeout)
-        running_processes_count = len([p for p in self.processes.values() if p.status == ServiceStatus.RUNNING])
-        running_copies_count = len([p for p in self.running_copy_operations.values() if p['status'] == ServiceStatus.RUNNING])
+        running_processes_count = len([p for p in self.processes.values() if p.status == STATUS_RUNNING])
+        running_copies_count = len([p for p in self.running_copy_operations.values() if p['status'] == STATUS_RUNNING])
         total_operations = running_processes_count + running_copies_count
         if total_operations > 0:
             logger.info(f"Waiting for {running_processes_count} torrent processes and {running_copies_count} copy operations to complete...")
@@ -533,20 +524,24 @@ class QbitManagerOrchestrator:
             start_time = time.time()
             timeout = 30  # 30 seconds
             
-            running_processes = [p for p in self.processes.values() if p.status == ServiceStatus.RUNNING]
-            running_copies = [p for p in self.running_copy_operations.values() if p['status'] == ServiceStatus.RUNNING]
+            running_processes = [p for p in self.processes.values() if p.status == STATUS_RUNNING]
+            running_copies = [p for p in self.running_copy_operations.values() if p['status'] == STATUS_RUNNING]
             while (running_processes or running_copies) and (time.time() - start_time) < timeout:
                 time.sleep(1)
                 # Check if any operations completed
-                running_processes = [p for p in self.processes.values() if p.status == ServiceStatus.RUNNING]
-                running_copies = [p for p in self.running_copy_operations.values() if p['status'] == ServiceStatus.RUNNING]
+                running_processes = [p for p in self.processes.values() if p.status == STATUS_RUNNING]
+                running_copies = [p for p in self.running_copy_operations.values() if p['status'] == STATUS_RUNNING]
+            
+            # Stop in-flight tree copies from starting further files
+            from util import COPY_ABORT
+            COPY_ABORT.set()
             
             # Force shutdown executors
             self.executor.shutdown(wait=False, timeout=5)
             self.copy_executor.shutdown(wait=False, timeout=5)
             
-            running_processes = [p for p in self.processes.values() if p.status == ServiceStatus.RUNNING]
-            running_copies = [p for p in self.running_copy_operations.values() if p['status'] == ServiceStatus.RUNNING]
+            running_processes = [p for p in self.processes.values() if p.status == STATUS_RUNNING]
+            running_copies = [p for p in self.running_copy_operations.values() if p['status'] == STATUS_RUNNING]
             if running_processes or running_copies:
                 logger.warning(f"{len(running_processes)} processes and {len(running_copies)} copy operations were interrupted and will be restored on restart")
         
@@ -559,6 +554,13 @@ class QbitManagerOrchestrator:
             except Exception as e:
                 logger.warning(f"Error closing qBittorrent client: {e}")
         
+        # Close pooled Arr notification connections
+        try:
+            from core import close_sessions
+            close_sessions()
+        except Exception as e:
+            logger.warning(f"Error closing Arr HTTP session: {e}")
+        
         logger.info("Orchestrator shutdown complete")
     
     def _save_current_state(self):
@@ -9,7 +9,7 @@ import typing
 from classes import TorrentInfo, BTIH
 
 # Import qBittorrent functions
-from qbit import get_all_torrents, get_torrents_by_tag
+from qbit import get_all_torrents, get_torrents_by_tag, get_files_counts
 
 # Import logging
 try:
@@ -27,6 +27,25 @@ if typing.TYPE_CHECKING:
 # Helper Functions
 # ===================================================================
 
+def parse_tags(tags) -> typing.FrozenSet[str]:
+    """
+    Parse qBittorrent tags into a set for exact membership checks.
+    
+    qBittorrent returns tags as a comma-separated string; a plain substring
+    test would match 'hdd' inside 'hddqueued'.
+    
+    Args:
+        tags: Comma-separated tag string, list of tags, or None
+        
+    Returns:
+        frozenset: Stripped, non-empty tag names
+    """
+    if not tags:
+        return frozenset()
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return frozenset(t for t in map(str.strip, tags) if t)
+
 def _convert_qbt_torrents_to_torrent_info(torrents, client=None) -> typing.List[TorrentInfo]:
     """
     Convert qBittorrent API torrent objects to TorrentInfo objects.
@@ -40,37 +59,20 @@ def _convert_qbt_torrents_to_torrent_info(torrents, client=None) -> typing.List[
     """
     torrent_infos = []
     
+    # Determine file counts efficiently (from listing fields where possible, the rest concurrently)
+    files_counts = get_files_counts(client, torrents) if client else {}
+    
     for torrent in torrents:
         try:
-            # Determine file count efficiently
-            files_count = 1  # Default assumption
-            if client:
-                try:
-                    files_list = client.torrents_files(torrent_hash=torrent.hash)
-                    files_count = len(files_list)
-                except:
-                    # Fallback - use default
-                    pass
-            
-            # Convert torrent object to dictionary for the factory method
-            torrent_dict = {
-                'hash': torrent.hash,
-                'name': torrent.name,
-                'content_path': getattr(torrent, 'content_path', ''),
-                'save_path': getattr(torrent, 'save_path', ''),
-                'root_path': getattr(torrent, 'root_path', ''),
-                'size': getattr(torrent, 'size', 0),
-                'category': getattr(torrent, 'category', '') or '',
-                'tags': getattr(torrent, 'tags', ''),
-                'tracker': getattr(torrent, 'tracker', ''),
-            }
+            files_count = files_counts.get(torrent.get('hash'), 1)
             
-            # Create TorrentInfo using the factory method
-            torrent_info = TorrentInfo.from_qbittorrent_api(torrent_dict, files_count)
+            # TorrentDictionary is a dict with the API key names already, so it goes
+            # to the factory as-is instead of being copied field by field via getattr
+            torrent_info = TorrentInfo.from_qbittorrent_api(torrent, files_count)
             torrent_infos.append(torrent_info)
             
         except Exception as e:
-            logger.warning(f"Failed to convert torrent {getattr(torrent, 'hash', 'UNKNOWN')} to TorrentInfo: {e}")
+            logger.warning(f"Failed to convert torrent {torrent.get('hash', 'UNKNOWN')} to TorrentInfo: {e}")
             continue
     
     return torrent_infos
@@ -97,7 +99,7 @@ def tag_existing_torrents_by_location(client: 'QBittorrentClient', dry_run=False
         dict: Summary of tagging operations including any copy operations
     """
     import config
-    from util import verify_copy
+    from util import verify_copy, fastcopy, parallel_copytree
     
     if not config.ENABLE_LOCATION_TAGGING:
         logger.warning("Location tagging is disabled in configuration")
@@ -127,14 +129,14 @@ def tag_existing_torrents_by_location(client: 'QBittorrentClient', dry_run=False
                     continue
                 
                 # Check current tags
-                current_tags = torrent_info.tags or ''
+                current_tags = parse_tags(torrent_info.tags)
                 has_ssd_tag = config.SSD_LOCATION_TAG in current_tags
                 has_hdd_tag = config.HDD_LOCATION_TAG in current_tags
                 
                 # Enhanced location analysis with dual-location support
                 if torrent_info.content_path.startswith(config.DOWNLOAD_PATH_SSD):
                     # Torrent is currently pointing to SSD location
-                    logger.debug(f"Analyzing SSD torrent: {torrent_info.name}")
+                    logger.debug("Analyzing SSD torrent: %s", torrent_info.name)
                     
                     # Always ensure SSD tag is present
                     if not has_ssd_tag:
@@ -145,17 +147,17 @@ def tag_existing_torrents_by_location(client: 'QBittorrentClient', dry_run=False
                         # Use category from TorrentInfo
                         torrent_category = torrent_info.category or ''
                         if torrent_category:
-                            expected_hdd_base = os.path.join(config.FINAL_DEST_BASE_HDD, torrent_category)
-                            expected_hdd_path = os.path.join(expected_hdd_base, torrent_info.name.strip())
+                            # Same path derivation the relocation code uses
+                            _, expected_hdd_path = torrent_info.hdd_paths(config.FINAL_DEST_BASE_HDD)
                             
                             if os.path.exists(expected_hdd_path):
                                 # HDD copy exists - ensure HDD tag is present
-                                logger.debug(f"HDD copy found for {torrent_info.name}")
+                                logger.debug("HDD copy found for %s", torrent_info.name)
                                 if not has_hdd_tag:
                                     hdd_tag_hashes.append(str(torrent_info.hash))
                             else:
                                 # HDD copy missing - needs copy operation
-                                logger.debug(f"HDD copy MISSING for {torrent_info.name}")
+                                logger.debug("HDD copy MISSING for %s", torrent_info.name)
                                 copy_operations.append({
                                     'hash': str(torrent_info.hash),
                                     'name': torrent_info.name,
@@ -186,7 +188,7 @@ def tag_existing_torrents_by_location(client: 'QBittorrentClient', dry_run=False
                         
                 elif torrent_info.content_path.startswith(config.FINAL_DEST_BASE_HDD):
                     # Torrent is currently pointing to HDD location
-                    logger.debug(f"Analyzing HDD torrent: {torrent_info.name}")
+                    logger.debug("Analyzing HDD torrent: %s", torrent_info.name)
                     if not has_hdd_tag:
                         hdd_tag_hashes.append(str(torrent_info.hash))
                 else:
@@ -320,9 +322,9 @@ def tag_existing_torrents_by_location(client: 'QBittorrentClient', dry_run=False
                         copy_start_time = time.time()
                         try:
                             if is_multi_file:
-                                shutil.copytree(item['ssd_path'], item['hdd_path'], copy_function=shutil.copy2, dirs_exist_ok=True)
+                                parallel_copytree(item['ssd_path'], item['hdd_path'], workers=config.COPY_WORKERS)
                             else:
-                                shutil.copy2(item['ssd_path'], item['hdd_path'])
+                                fastcopy(item['ssd_path'], item['hdd_path'])
                             
                             copy_time = time.time() - copy_start_time
                             logger.info(f"   ✅ Copy completed in {copy_time:.1f}s")
@@ -473,6 +475,7 @@ def auto_tag_torrent(client: 'QBittorrentClient', torrent_info: TorrentInfo, cur
         return True
     
     # Check if already has location tags
+    current_tags = parse_tags(current_tags)
     has_ssd_tag = config.SSD_LOCATION_TAG in current_tags
     has_hdd_tag = config.HDD_LOCATION_TAG in current_tags
     
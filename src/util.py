@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import stat
+import errno
 import shutil
 import time
 import signal
 import functools
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 
+# xxhash and blake3 are optional; blake2b is used when they aren't installed
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# fcntl is Unix-only; reflink copies are skipped without it
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Import classes from classes module
 from classes import TimeoutError, LockError
 
@@ -66,14 +89,507 @@ def retry_with_backoff(max_attempts=3, base_delay=1, max_delay=30):
 # ===================================================================
 
 
+# ===================================================================
+# File Copy Utilities
+# ===================================================================
+_COPY_CHUNK = 1024 * 1024  # 1 MiB default chunk for read/write fallback
+_RANGE_CHUNK = 64 * 1024 * 1024  # Max bytes per copy_file_range/sendfile call, so aborts are noticed
+
+# Set on service shutdown: running copies stop at the next chunk, queued files
+# are never started and retries stop
+COPY_ABORT = threading.Event()
+
+def _check_abort(path):
+    """Raise InterruptedError if copies are being aborted."""
+    if COPY_ABORT.is_set():
+        raise InterruptedError(errno.EINTR, "Copy aborted", path)
+
+# Errors meaning "this kernel/filesystem can't do it", not a real I/O failure
+_FASTCOPY_UNSUPPORTED = frozenset(
+    getattr(errno, name) for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EBADF')
+    if hasattr(errno, name)
+)
+
+# In-kernel copy primitives, tried in order; all take (src_fd, dst_fd, count)
+_FD_COPY_OPS = tuple(op for op in (
+    getattr(os, 'copy_file_range', None),
+    (lambda src_fd, dst_fd, count: os.sendfile(dst_fd, src_fd, None, count))
+    if hasattr(os, 'sendfile') else None,
+) if op is not None)
+
+def _fadvise(fd, advice):
+    """posix_fadvise over the whole file by constant name; a no-op where unsupported."""
+    advice = getattr(os, advice, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+def _fsync_if_configured(fd):
+    """fsync a copy's destination when processing.copy.fsync_after_copy is on."""
+    import config
+    if config.FSYNC_AFTER_COPY:
+        os.fsync(fd)
+
+def _drop_cache(*fds):
+    """
+    Drop the given files from the page cache if processing.copy.drop_cache_after_copy is on.
+
+    Relocated data is read once, so caching it only evicts other processes'
+    working set. Dirty pages can't be dropped until written back, so a
+    destination is fully released only after an fsync (or by the
+    verification re-read, which drops it again when done).
+    """
+    import config
+    if config.DROP_CACHE_AFTER_COPY:
+        for fd in fds:
+            _fadvise(fd, 'POSIX_FADV_DONTNEED')
+
+# ioctl(dst_fd, FICLONE, src_fd): share extents on CoW filesystems (btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+def _try_reflink(src_fd, dst_fd):
+    """Clone src into dst without copying data. Returns False if the filesystem can't."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _FASTCOPY_UNSUPPORTED or e.errno == errno.ENOTTY:
+            return False
+        raise
+
+def _copy_fd_range(src_fd, dst_fd, size, copy_op):
+    """Copy size bytes with copy_op (copy_file_range/sendfile). Returns bytes copied."""
+    copied = 0
+    while copied < size:
+        _check_abort(None)
+        n = copy_op(src_fd, dst_fd, min(size - copied, _RANGE_CHUNK))
+        if n == 0:
+            break
+        copied += n
+    return copied
+
+def _copy_fd_buffered(src_fd, dst_fd, buffer_size):
+    """Plain read/write loop reusing a single buffer."""
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as fsrc:
+        while True:
+            _check_abort(None)
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, view[written:n])
+
+def fastcopy(src, dst, buffer_size=None):
+    """
+    Copy a file and its metadata, keeping data in the kernel where possible.
+
+    On Linux, when source and destination are on the same filesystem, the
+    file is first cloned with the FICLONE ioctl (instant on CoW filesystems,
+    like cp --reflink=auto). Otherwise this tries copy_file_range (server-side
+    copies on filesystems that support it), then sendfile, then a buffered
+    read/write loop. On other platforms shutil.copy2 already uses the native fast path
+    (fcopyfile on macOS, CopyFile2 on Windows) and is used as-is.
+
+    Signature matches shutil.copy2 so it can be passed as copytree's
+    copy_function.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (or existing directory)
+        buffer_size: Chunk size for the read/write fallback
+
+    Returns:
+        str: Destination path
+    """
+    if not sys.platform.startswith('linux'):
+        return shutil.copy2(src, dst)
+
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+        src_st = os.fstat(src_fd)
+        size = src_st.st_size
+        copied = 0
+
+        if size and src_st.st_dev == os.fstat(dst_fd).st_dev and _try_reflink(src_fd, dst_fd):
+            logger.debug("Reflinked %s -> %s", src, dst)
+            copied = size
+
+        for copy_op in _FD_COPY_OPS if copied < size else ():
+            try:
+                copied = _copy_fd_range(src_fd, dst_fd, size, copy_op)
+                break
+            except OSError as e:
+                # Only fall through if nothing was written yet
+                if e.errno not in _FASTCOPY_UNSUPPORTED or os.lseek(dst_fd, 0, os.SEEK_CUR) != 0:
+                    raise
+
+        if copied < size:
+            # Fast paths unavailable or short (e.g. file grew) - finish with plain I/O
+            os.lseek(src_fd, copied, os.SEEK_SET)
+            os.lseek(dst_fd, copied, os.SEEK_SET)
+            _copy_fd_buffered(src_fd, dst_fd, buffer_size or _COPY_CHUNK)
+
+        _fsync_if_configured(dst_fd)
+        _drop_cache(src_fd, dst_fd)
+
+    shutil.copystat(src, dst)
+    return dst
+
+def _new_hasher(algo=None):
+    """
+    Return a hash object for algo (default: config.VERIFY_HASH).
+
+    'xxh3' and 'xxh64' need the xxhash package and 'blake3' the blake3
+    package; without them blake2b is used. Any other name is passed to
+    hashlib.new.
+    """
+    if algo is None:
+        import config
+        algo = config.VERIFY_HASH
+    if algo == 'xxh3' and xxhash is not None:
+        return xxhash.xxh3_128()
+    if algo == 'xxh64' and xxhash is not None:
+        return xxhash.xxh64()
+    if algo == 'blake3' and blake3 is not None:
+        return blake3.blake3()
+    if algo in ('xxh3', 'xxh64', 'blake3'):
+        _warn_hash_fallback(algo)
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(algo)
+
+@functools.lru_cache(maxsize=None)
+def _warn_hash_fallback(algo):
+    """Log once per algorithm that the configured checksum isn't available."""
+    package = 'blake3' if algo == 'blake3' else 'xxhash'
+    logger.warning(f"Checksum '{algo}' needs the '{package}' package, which is not installed; "
+                   f"using blake2b for copy verification instead.")
+
+def _read_prefetched(f, buffer_size):
+    """
+    Yield successive chunks of an open binary file, double-buffered.
+
+    While the caller consumes one buffer, the next chunk is read into the other
+    on a helper thread, so the disk stays busy during hashing instead of idling
+    between reads. Each yielded memoryview is only valid until the next one is
+    requested.
+    """
+    bufs = (bytearray(buffer_size), bytearray(buffer_size))
+    views = tuple(memoryview(b) for b in bufs)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as reader:
+        current = 0
+        pending = reader.submit(f.readinto, bufs[current])
+        while True:
+            n = pending.result()
+            if not n:
+                break
+            # Start filling the other buffer before handing this one out
+            pending = reader.submit(f.readinto, bufs[current ^ 1])
+            yield views[current][:n]
+            current ^= 1
+
+def hash_file(path, algo=None, buffer_size=None):
+    """Hash a file's contents with the same algorithm copy_and_hash uses. Returns hex digest.
+
+    Files larger than one buffer are read ahead on a helper thread (see
+    _read_prefetched) so reading and hashing overlap.
+    """
+    hasher = _new_hasher(algo)
+    buffer_size = buffer_size or _COPY_CHUNK
+    with open(path, 'rb', buffering=0) as f:
+        _fadvise(f.fileno(), 'POSIX_FADV_SEQUENTIAL')
+        if os.fstat(f.fileno()).st_size > buffer_size:
+            for chunk in _read_prefetched(f, buffer_size):
+                hasher.update(chunk)
+        else:
+            hasher.update(f.read())
+        _drop_cache(f.fileno())
+    return hasher.hexdigest()
+
+def copy_and_hash(src, dst, algo=None, buffer_size=None):
+    """
+    Copy a file and hash it from the same read stream.
+
+    Each chunk read from src is fed to the hasher and written to dst, so the
+    source is read once for both copy and verification. On Linux, when both
+    paths are on the same filesystem, dst is first cloned with FICLONE (see
+    fastcopy) and the clone is read back and hashed instead. Metadata is
+    copied with shutil.copystat like shutil.copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+        algo: Hash algorithm (default config.VERIFY_HASH, see _new_hasher)
+        buffer_size: Read/write chunk size
+
+    Returns:
+        str: Hex digest of the source data
+    """
+    hasher = _new_hasher(algo)
+    buf = bytearray(buffer_size or _COPY_CHUNK)
+    view = memoryview(buf)
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'w+b', buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+        src_st = os.fstat(src_fd)
+        reflinked = (sys.platform.startswith('linux') and src_st.st_size
+                     and src_st.st_dev == os.fstat(dst_fd).st_dev and _try_reflink(src_fd, dst_fd))
+        if reflinked:
+            logger.debug("Reflinked %s -> %s, hashing the clone", src, dst)
+            _fadvise(dst_fd, 'POSIX_FADV_SEQUENTIAL')
+        reader = fdst if reflinked else fsrc
+        while True:
+            _check_abort(src)
+            n = reader.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            hasher.update(chunk)
+            if reflinked:
+                continue
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, chunk[written:])
+        _fsync_if_configured(dst_fd)
+        _drop_cache(src_fd, dst_fd)
+    shutil.copystat(src, dst)
+    return hasher.hexdigest()
+
+# Copy errors that a retry cannot fix (full disk, permissions, read-only or bad target)
+PERMANENT_COPY_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('ENOSPC', 'EDQUOT', 'EACCES', 'EPERM', 'EROFS', 'ENOTDIR')
+    if hasattr(errno, name)
+)
+
+def is_permanent_copy_error(exc):
+    """Return True if a copy failed with an errno that retrying won't fix (or copies are being aborted)."""
+    return COPY_ABORT.is_set() or getattr(exc, 'errno', None) in PERMANENT_COPY_ERRNOS
+
+_SMALL_FILE_BYTES = 1024 * 1024  # Files below this are batched into one task
+_SMALL_FILE_BATCH = 64
+
+def _copy_batch(pairs, hashed=False):
+    """
+    Copy a list of (src, dst, size) file entries.
+
+    Returns (errors, digests): failures as (src, dst, error) and, when hashed
+    is True, (dst, size, digest) for each file copied with copy_and_hash.
+    """
+    errors = []
+    digests = []
+    for src, dst, size in pairs:
+        _check_abort(src)
+        try:
+            if hashed:
+                digests.append((dst, size, copy_and_hash(src, dst)))
+            else:
+                fastcopy(src, dst)
+        except OSError as e:
+            if is_permanent_copy_error(e):
+                raise  # e.g. ENOSPC: the remaining files would fail the same way
+            errors.append((src, dst, str(e)))
+    return errors, digests
+
+def parallel_copytree(src, dst, workers=4, manifest=None):
+    """
+    Copy a directory tree with file copies spread across a thread pool.
+
+    The directory skeleton is created serially, then files are copied with
+    fastcopy by `workers` threads. Large files are one task each; small
+    files are grouped so per-file executor overhead is amortised. Like
+    shutil.copytree(dirs_exist_ok=True), existing directories are reused and
+    failures are collected into a single shutil.Error, except permanent
+    errors (see is_permanent_copy_error), which cancel the copies not yet
+    started and are raised as-is. Setting COPY_ABORT stops it the same way.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        workers: Number of copy threads
+        manifest: Optional dict; if given, files are copied with copy_and_hash
+            and it is filled with {relpath: (size, digest)} for verify_copy
+
+    Returns:
+        str: Destination path
+    """
+    hashed = manifest is not None
+    batches = []
+    small = []
+    dirs = []
+    errors = []
+
+    # Iterative scandir walk: mirror directories, collect file entries
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        dirs.append((src_dir, dst_dir))
+        try:
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    dst_path = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        stack.append((entry.path, dst_path))
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError as e:
+                        errors.append((entry.path, dst_path, str(e)))
+                        continue
+                    if size < _SMALL_FILE_BYTES:
+                        small.append((entry.path, dst_path, size))
+                        if len(small) >= _SMALL_FILE_BATCH:
+                            batches.append(small)
+                            small = []
+                    else:
+                        batches.append([(entry.path, dst_path, size)])
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+    if small:
+        batches.append(small)
+    # Largest first, so a big file isn't left running alone at the end
+    batches.sort(key=lambda batch: sum(entry[2] for entry in batch), reverse=True)
+
+    copy_batch = functools.partial(_copy_batch, hashed=hashed)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(copy_batch, batch) for batch in batches]
+        try:
+            for future in as_completed(futures):
+                batch_errors, batch_digests = future.result()
+                errors.extend(batch_errors)
+                for dst_path, size, digest in batch_digests:
+                    manifest[os.path.relpath(dst_path, dst)] = (size, digest)
+        except BaseException:
+            # Permanent error (e.g. ENOSPC): don't start copies that would fail the same way
+            for future in futures:
+                future.cancel()
+            raise
+
+    # Directory metadata last, so file writes don't bump the copied mtimes
+    for src_dir, dst_dir in reversed(dirs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+
+    if errors:
+        raise shutil.Error(errors)
+    return dst
+
+# ===================================================================
+
+
 # ===================================================================
 # Helper Functions
 # ===================================================================
-def get_available_space_gb(path):
-    """Gets available disk space in GB for the given path using shutil."""
+def stat_or_none(path, follow_symlinks=True):
+    """Single stat() for existence and type checks; returns None if the path does not exist."""
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+# Below this many files a thread pool costs more than it saves
+_RMTREE_PARALLEL_MIN = 100
+
+def _unlink_quiet(path):
+    """Unlink a path, returning the OSError instead of raising (missing is fine)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        return e
+    return None
+
+def fast_rmtree(path, workers=8):
+    """
+    Remove a directory tree iteratively using os.scandir.
+
+    scandir supplies the entry type from the directory listing, so files are
+    unlinked without a separate stat, and symlinks are removed rather than
+    followed. Trees with many files (season packs) are unlinked by a thread
+    pool, since each unlink is a separate metadata round-trip. Directories
+    are removed bottom-up once emptied. A failing entry doesn't stop the
+    walk; everything else is still removed before raising.
+
+    Like shutil.rmtree, path itself must not be a symlink: deleting through
+    it would empty the directory it points at.
+
+    Args:
+        path: Directory to remove
+        workers: Unlink threads for trees of _RMTREE_PARALLEL_MIN files or more
+
+    Raises:
+        OSError: If path is a symlink, or the first error hit if any entry
+            could not be removed
+    """
+    if stat.S_ISLNK(os.lstat(path).st_mode):
+        raise OSError("Cannot call rmtree on a symbolic link")
+
+    stack = [path]
+    dirs = []
+    files = []
+    errors = []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError as e:
+            errors.append(e)
+
+    if len(files) >= _RMTREE_PARALLEL_MIN and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rmtree") as executor:
+            results = list(executor.map(_unlink_quiet, files, chunksize=32))
+    else:
+        results = [_unlink_quiet(f) for f in files]
+    errors.extend(e for e in results if e is not None)
+
+    for directory in reversed(dirs):
+        try:
+            os.rmdir(directory)
+        except OSError as e:
+            # Parents of a failed entry are left non-empty; only report the root cause
+            if not errors:
+                errors.append(e)
+    if errors:
+        if len(errors) > 1:
+            logger.warning(f"{len(errors)} entries under {path} could not be removed")
+        raise errors[0]
+
+# path -> (available_gb, monotonic timestamp) for get_available_space_gb(max_age=...)
+_space_cache = {}
+
+def get_available_space_gb(path, max_age=0):
+    """Gets available disk space in GB for the given path using shutil.
+
+    With max_age > 0, a reading younger than max_age seconds is reused.
+    """
+    if max_age > 0:
+        cached = _space_cache.get(path)
+        if cached is not None and time.monotonic() - cached[1] < max_age:
+            return cached[0]
     try:
         usage = shutil.disk_usage(path)
         available_gb = usage.free / (1024**3)
+        _space_cache[path] = (available_gb, time.monotonic())
         return available_gb
     except FileNotFoundError:
         logger.error(f"Path '{path}' not found for disk usage check.")
@@ -82,6 +598,13 @@ def get_available_space_gb(path):
         logger.error(f"Error getting disk usage for {path}: {e}")
         return None
 
+def invalidate_space_cache(path=None):
+    """Drop cached free-space readings (all paths if path is None), e.g. after deleting data."""
+    if path is None:
+        _space_cache.clear()
+    else:
+        _space_cache.pop(path, None)
+
 def get_dir_stats(path):
     """Calculates total size (bytes) and item count (files+dirs) for a directory path."""
     total_size = 0; item_count = 1
@@ -97,6 +620,28 @@ def get_dir_stats(path):
     except OSError as e: logger.warning(f"Error walking directory {path}: {e}")
     return total_size, item_count
 
+def get_tree_sizes(path):
+    """Return {relative path: size} for every regular file under a directory (symlinks skipped)."""
+    sizes = {}
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    else:
+                        try:
+                            sizes[os.path.relpath(entry.path, path)] = entry.stat().st_size
+                        except OSError as e:
+                            logger.warning(f"Could not get size of {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Error scanning directory {current}: {e}")
+    return sizes
+
 def cleanup_destination(path):
     """Attempts to remove a file or directory, used for cleaning up failed copies."""
     logger.info(f"Attempting to cleanup possibly incomplete destination: {path}")
@@ -104,20 +649,31 @@ def cleanup_destination(path):
     # Import config to check DRY_RUN flag
     import config
     
+    # lstat: a symlinked destination is removed itself, never the tree it points at
+    st = stat_or_none(path, follow_symlinks=False)
+    is_link = st is not None and stat.S_ISLNK(st.st_mode)
+    is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+    is_file = st is not None and stat.S_ISREG(st.st_mode)
+    
     if config.DRY_RUN:
-        if os.path.isdir(path):
+        if is_link:
+            logger.info(f"[DRY RUN] Would remove symlink: {path}")
+        elif is_dir:
             logger.info(f"[DRY RUN] Would remove directory: {path}")
-        elif os.path.isfile(path):
+        elif is_file:
             logger.info(f"[DRY RUN] Would remove file: {path}")
         else:
             logger.info(f"[DRY RUN] Path not found, no cleanup needed: {path}")
         return
     
     try:
-        if os.path.isdir(path): 
-            shutil.rmtree(path)
+        if is_link:
+            os.unlink(path)
+            logger.info("Cleanup successful (removed symlink).")
+        elif is_dir: 
+            fast_rmtree(path)
             logger.info("Cleanup successful (removed directory).")
-        elif os.path.isfile(path): 
+        elif is_file: 
             os.remove(path)
             logger.info("Cleanup successful (removed file).")
         else: 
@@ -126,8 +682,50 @@ def cleanup_destination(path):
         logger.error(f"Cleanup FAILED: {e}")
 
 
-def verify_copy(src_path, dst_path, is_multi):
-    """Verifies copy using size (single file) or size+count (multi-file)."""
+def _verify_manifest(dst_path, manifest, digest_algo=None):
+    """Check every file recorded in a parallel_copytree manifest against the destination.
+
+    Sizes are checked first so a truncated copy fails without reading any
+    data; the destination files are then hashed by config.COPY_WORKERS threads.
+    """
+    import config
+
+    for relpath, (size, _) in manifest.items():
+        path = os.path.join(dst_path, relpath)
+        try:
+            dst_size = os.stat(path).st_size
+        except OSError as e:
+            logger.error(f"Verification FAILED! Cannot stat '{path}': {e}")
+            return False
+        if dst_size != size:
+            logger.error(f"Verification FAILED! Size mismatch for '{relpath}' ({size} vs {dst_size}).")
+            return False
+
+    def check(item):
+        relpath, (_, digest) = item
+        return relpath, hash_file(os.path.join(dst_path, relpath), digest_algo) == digest
+
+    with ThreadPoolExecutor(max_workers=max(1, config.COPY_WORKERS)) as executor:
+        futures = [executor.submit(check, item) for item in manifest.items()]
+        for future in as_completed(futures):
+            relpath, ok = future.result()
+            if not ok:
+                for pending in futures:
+                    pending.cancel()
+                logger.error(f"Verification FAILED! Checksum mismatch for '{relpath}'.")
+                return False
+    logger.info(f"Verification successful ({len(manifest)} file checksums match manifest).")
+    return True
+
+def verify_copy(src_path, dst_path, is_multi, src_digest=None, digest_algo=None, manifest=None):
+    """Verifies copy using size (single file) or per-file sizes (multi-file).
+
+    Sizes are always compared before any content is hashed, so a short or
+    missing file fails without reading data. If src_digest is given (from copy_and_hash), a single-file copy is also
+    checked by hashing only the destination. A multi-file copy with a
+    manifest (from parallel_copytree) is checked against the manifest only,
+    without walking the source again.
+    """
     logger.debug("Verifying copy...")
     if not src_path or not dst_path:
         logger.error(f"Verification ERROR: Invalid paths provided - src: '{src_path}', dst: '{dst_path}'")
@@ -139,31 +737,46 @@ def verify_copy(src_path, dst_path, is_multi):
         logger.error(f"Verification ERROR: Destination path '{dst_path}' does not exist!")
         return False
     try:
+        if is_multi and manifest is not None:
+            return _verify_manifest(dst_path, manifest, digest_algo)
         if not is_multi: # Single file comparison
             src_size = os.path.getsize(src_path)
             dst_size = os.path.getsize(dst_path)
-            logger.debug(f"Source File Size: {src_size}")
-            logger.debug(f"Dest File Size  : {dst_size}")
+            logger.debug("Source File Size: %s", src_size)
+            logger.debug("Dest File Size  : %s", dst_size)
             if src_size == dst_size and src_size >= 0: 
+                if src_digest is not None:
+                    dst_digest = hash_file(dst_path, digest_algo)
+                    if dst_digest != src_digest:
+                        logger.error(f"Verification FAILED! Checksum mismatch (source {src_digest}, dest {dst_digest}).")
+                        return False
+                    logger.info("Verification successful (file sizes and checksums match).")
+                    return True
                 logger.info("Verification successful (file sizes match).")
                 return True
             else: 
-                logger.error("Verification FAILED! File sizes mismatch or invalid.")
+                logger.error(f"Verification FAILED! Size mismatch: destination is {dst_size} bytes, expected {src_size}.")
                 return False
         else: # Multi-file directory comparison
-            src_size, src_count = get_dir_stats(src_path)
-            dst_size, dst_count = get_dir_stats(dst_path)
-            logger.debug(f"Source Dir : Size={src_size}, Items={src_count}")
-            logger.debug(f"Dest Dir   : Size={dst_size}, Items={dst_count}")
-            if src_size == dst_size and src_count == dst_count and src_count > 0 and src_size >= 0: 
-                logger.info("Verification successful (total size/item count match).")
-                return True
-            elif src_size == 0 and dst_size == 0 and src_count == dst_count: 
-                logger.info("Verification successful (both source and dest seem empty/zero size).")
+            # Per-file sizes: catches a truncated file even when totals happen to line up
+            src_sizes = get_tree_sizes(src_path)
+            dst_sizes = get_tree_sizes(dst_path)
+            logger.debug("Source Dir : Files=%s", len(src_sizes))
+            logger.debug("Dest Dir   : Files=%s", len(dst_sizes))
+            if src_sizes == dst_sizes:
+                logger.info(f"Verification successful ({len(src_sizes)} file sizes match).")
                 return True
-            else: 
-                logger.error("Verification FAILED! Size or item count mismatch.")
+            missing = src_sizes.keys() - dst_sizes.keys()
+            if missing:
+                logger.error(f"Verification FAILED! Copy incomplete: {len(missing)} file(s) missing (e.g. '{next(iter(missing))}').")
                 return False
+            for relpath, size in src_sizes.items():
+                if dst_sizes[relpath] != size:
+                    logger.error(f"Verification FAILED! Size mismatch: '{relpath}' is {dst_sizes[relpath]} bytes, expected {size}.")
+                    return False
+            extra = dst_sizes.keys() - src_sizes.keys()
+            logger.error(f"Verification FAILED! Destination has {len(extra)} unexpected file(s) (e.g. '{next(iter(extra))}').")
+            return False
     except OSError as e: 
         logger.error(f"Verification ERROR: Could not get stats for paths '{src_path}' or '{dst_path}': {e}")
         return False
@@ -0,0 +1,14 @@
+"""Shared pytest setup: make src/ importable and give config.py a config file."""
+
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# config.py reads ./config.toml when first imported; use the shipped defaults
+_config_dir = tempfile.mkdtemp(prefix='qbit-manager-tests-')
+shutil.copy(os.path.join(ROOT, 'root', 'defaults', 'config.toml'), _config_dir)
+os.chdir(_config_dir)
@@ -0,0 +1,28 @@
+"""Tests for TorrentInfo in classes.py."""
+
+from classes import TorrentInfo
+
+
+def test_is_multi_file_follows_num_files_updates():
+    info = TorrentInfo.from_hash_only('a' * 40)
+    assert not info.is_multi_file
+
+    info.num_files = 3
+
+    assert info.is_multi_file
+
+
+def test_from_dict_round_trips_to_dict():
+    info = TorrentInfo.from_dict({'hash_v1': 'a' * 40, 'name': 'n', 'content_path': '/x/n',
+                                  'save_path': '/x', 'size': 5, 'num_files': 2, 'hash_v2': 'b' * 64})
+
+    assert TorrentInfo.from_dict(info.to_dict()) == info
+    assert info.is_multi_file
+
+
+def test_from_qbittorrent_api_maps_infohash_v2():
+    v2 = 'c' * 64
+    info = TorrentInfo.from_qbittorrent_api({'hash': 'a' * 40, 'name': 'n', 'content_path': '/x/n',
+                                             'save_path': '/x', 'size': 1, 'infohash_v2': v2}, 1)
+
+    assert info.hash_v2 == v2
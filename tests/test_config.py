@@ -0,0 +1,21 @@
+"""Tests for configuration validation in config.py."""
+
+import pytest
+
+import config
+
+
+def _errors_for_hash(monkeypatch, algo):
+    monkeypatch.setattr(config, 'VERIFY_HASH', algo)
+    errors, _ = config.validate_config()
+    return [e for e in errors if 'verify_hash' in e]
+
+
+@pytest.mark.parametrize('algo', ['xxh3', 'xxh64', 'blake3', 'sha256', 'md5'])
+def test_validate_config_accepts_supported_hashes(monkeypatch, algo):
+    assert _errors_for_hash(monkeypatch, algo) == []
+
+
+@pytest.mark.parametrize('algo', ['xxh3_128', 'shake_128', 'nope'])
+def test_validate_config_rejects_unsupported_hashes(monkeypatch, algo):
+    assert _errors_for_hash(monkeypatch, algo)
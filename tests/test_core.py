@@ -0,0 +1,167 @@
+"""Tests for relocation helpers in core.py."""
+
+import os
+
+import core
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def test_hdd_copy_complete_ignores_extra_destination_files(tmp_path):
+    src, dst = tmp_path / "ssd", tmp_path / "hdd"
+    for root in (src, dst):
+        _write(root / "Season 1" / "e01.mkv", b"a" * 10)
+        _write(root / "e02.mkv", b"b" * 20)
+    _write(dst / "Season 1" / "e01.en.srt", b"subs")
+    _write(dst / "movie.nfo", b"<nfo/>")
+
+    assert core._hdd_copy_complete(str(src), os.stat(src), str(dst), os.stat(dst))
+
+
+def test_hdd_copy_complete_detects_missing_or_short_files(tmp_path):
+    src, dst = tmp_path / "ssd", tmp_path / "hdd"
+    _write(src / "e01.mkv", b"a" * 10)
+    _write(src / "e02.mkv", b"b" * 20)
+    _write(dst / "e01.mkv", b"a" * 10)
+
+    assert not core._hdd_copy_complete(str(src), os.stat(src), str(dst), os.stat(dst))
+
+    _write(dst / "e02.mkv", b"b" * 5)
+    assert not core._hdd_copy_complete(str(src), os.stat(src), str(dst), os.stat(dst))
+
+
+def test_notify_after_shutdown_falls_back_to_synchronous_send(monkeypatch):
+    sent = []
+    monkeypatch.setattr(core.config, 'DRY_RUN', False)
+    monkeypatch.setattr(core, 'notify_arr_scan_downloads_batch',
+                        lambda service, items, arr_config: sent.append((service, items)) or len(items))
+
+    class ShutDownExecutor:
+        def submit(self, *args, **kwargs):
+            raise RuntimeError('cannot schedule new futures after shutdown')
+
+    monkeypatch.setattr(core, '_ARR_EXECUTOR', ShutDownExecutor())
+
+    result = core.notify_arr_scan_downloads('sonarr', 'a' * 40, {'NOTIFY_ARR_ENABLED': True}, '/hdd/x')
+
+    assert result is None
+    assert sent == [('sonarr', [('a' * 40, '/hdd/x')])]
+
+
+def test_notifications_queued_together_share_one_batch(monkeypatch):
+    batches = []
+    monkeypatch.setattr(core.config, 'DRY_RUN', False)
+    monkeypatch.setattr(core, 'notify_arr_scan_downloads_batch',
+                        lambda service, items, arr_config: batches.append((service, items)) or len(items))
+    monkeypatch.setattr(core, '_ARR_BATCH_WINDOW', 0.2)
+    arr_config = {'NOTIFY_ARR_ENABLED': True}
+
+    future = core.notify_arr_scan_downloads('radarr', 'a' * 40, arr_config, '/hdd/a')
+    assert core.notify_arr_scan_downloads('radarr', 'b' * 40, arr_config, '/hdd/b') is None
+    future.result(timeout=5)
+
+    assert batches == [('radarr', [('a' * 40, '/hdd/a'), ('b' * 40, '/hdd/b')])]
+
+
+class FakeTorrent:
+    def __init__(self, hash, state, save_path):
+        self.hash, self.state, self.save_path = hash, state, save_path
+
+
+class FakeRelocationClient:
+    """Minimal qBittorrent stand-in that records API calls in order."""
+
+    def __init__(self, torrents, finish_moving=True):
+        self.torrents = {t.hash: t for t in torrents}
+        self.finish_moving = finish_moving
+        self.calls = []
+
+    def torrents_info(self, torrent_hashes):
+        return [self.torrents[h] for h in torrent_hashes.split('|') if h in self.torrents]
+
+    def torrents_pause(self, torrent_hashes):
+        self.calls.append(('pause', torrent_hashes))
+        for h in torrent_hashes.split('|'):
+            self.torrents[h].state = 'pausedUP'
+
+    def torrents_resume(self, torrent_hashes):
+        self.calls.append(('resume', torrent_hashes))
+
+    def torrents_set_location(self, location, torrent_hashes):
+        self.calls.append(('set_location', torrent_hashes))
+        for h in torrent_hashes.split('|'):
+            self.torrents[h].save_path = location
+            if not self.finish_moving:
+                self.torrents[h].state = 'moving'
+
+    def torrents_remove_tags(self, **kwargs):
+        pass
+
+
+def _relocation_setup(tmp_path, monkeypatch):
+    from classes import TorrentInfo
+
+    ssd, hdd = tmp_path / "ssd", tmp_path / "hdd"
+    _write(ssd / "movies" / "film.mkv", b"x" * 100)
+    (hdd / "movies").mkdir(parents=True)
+    monkeypatch.setattr(core.config, 'DRY_RUN', False)
+    monkeypatch.setattr(core, 'RELOCATION_MOVE_TIMEOUT', 0.2)
+    info = TorrentInfo.from_dict({'hash_v1': 'a' * 40, 'name': 'film.mkv', 'category': 'movies',
+                                  'content_path': str(ssd / "movies" / "film.mkv"),
+                                  'save_path': str(ssd / "movies"), 'size': 100, 'num_files': 1})
+    return info, ssd, hdd
+
+
+def test_relocation_copies_before_set_location_and_deletes_after(tmp_path, monkeypatch):
+    info, ssd, hdd = _relocation_setup(tmp_path, monkeypatch)
+    client = FakeRelocationClient([FakeTorrent('a' * 40, 'uploading', str(ssd / "movies"))])
+    seen_at_set_location = []
+    original = client.torrents_set_location
+
+    def set_location(location, torrent_hashes):
+        seen_at_set_location.append((hdd / "movies" / "film.mkv").exists())
+        original(location, torrent_hashes)
+
+    client.torrents_set_location = set_location
+
+    results = core.relocate_and_delete_ssd_batch(client, [info], str(hdd), str(ssd))
+
+    assert results == {'a' * 40: True}
+    assert seen_at_set_location == [True]
+    assert not (ssd / "movies" / "film.mkv").exists()
+    assert (hdd / "movies" / "film.mkv").read_bytes() == b"x" * 100
+    assert [c[0] for c in client.calls] == ['pause', 'set_location', 'resume']
+
+
+def test_relocation_keeps_ssd_data_while_qbittorrent_is_moving(tmp_path, monkeypatch):
+    info, ssd, hdd = _relocation_setup(tmp_path, monkeypatch)
+    client = FakeRelocationClient([FakeTorrent('a' * 40, 'pausedUP', str(ssd / "movies"))],
+                                  finish_moving=False)
+
+    results = core.relocate_and_delete_ssd_batch(client, [info], str(hdd), str(ssd))
+
+    assert results == {'a' * 40: False}
+    assert (ssd / "movies" / "film.mkv").exists()
+
+
+def test_relocation_retries_resume_when_group_resume_fails(tmp_path, monkeypatch):
+    info, ssd, hdd = _relocation_setup(tmp_path, monkeypatch)
+    client = FakeRelocationClient([FakeTorrent('a' * 40, 'uploading', str(ssd / "movies"))])
+    original = client.torrents_resume
+    attempts = []
+
+    def flaky_resume(torrent_hashes):
+        attempts.append(torrent_hashes)
+        if len(attempts) == 1:
+            raise ConnectionError("qBittorrent went away")
+        original(torrent_hashes)
+
+    client.torrents_resume = flaky_resume
+
+    results = core.relocate_and_delete_ssd_batch(client, [info], str(hdd), str(ssd))
+
+    assert attempts == ['a' * 40, 'a' * 40]
+    assert results == {'a' * 40: True}
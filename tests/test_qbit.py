@@ -0,0 +1,58 @@
+"""Tests for qBittorrent listing helpers in qbit.py."""
+
+import pytest
+
+import qbit
+
+
+class FakeClient:
+    """Answers torrents_files with a fixed file list and records the calls."""
+
+    def __init__(self, files):
+        self.files = files
+        self.files_calls = []
+
+    def torrents_files(self, torrent_hash, **kwargs):
+        self.files_calls.append(torrent_hash)
+        return self.files
+
+
+def _listing(content_path, root_path, save_path='/downloads/sonarr'):
+    return {'hash': 'a' * 40, 'content_path': content_path,
+            'root_path': root_path, 'save_path': save_path}
+
+
+@pytest.mark.parametrize('torrent, expected', [
+    # Single file, "Don't create subfolder"
+    (_listing('/downloads/sonarr/show.s01e01.mkv', ''), 1),
+    # Single file, "Create subfolder"
+    (_listing('/downloads/sonarr/show.s01e01/show.s01e01.mkv', '/downloads/sonarr/show.s01e01'), 1),
+    # Multi-file, "Original" / "Create subfolder"
+    (_listing('/downloads/sonarr/show.s01', '/downloads/sonarr/show.s01'), 2),
+    # Multi-file, "Don't create subfolder"
+    (_listing('/downloads/sonarr', ''), 2),
+])
+def test_get_files_count_from_listing_paths(torrent, expected):
+    client = FakeClient(files=[])
+
+    assert qbit.get_files_count(client, torrent) == expected
+    assert client.files_calls == []
+
+
+def test_get_files_count_falls_back_without_root_path():
+    client = FakeClient(files=[{}, {}, {}])
+    torrent = {'hash': 'b' * 40, 'content_path': '/downloads/x', 'save_path': '/downloads'}
+
+    assert qbit.get_files_count(client, torrent) == 3
+    assert client.files_calls == ['b' * 40]
+
+
+def test_get_files_counts_mixes_local_and_fetched():
+    client = FakeClient(files=[{}, {}])
+    single = _listing('/downloads/sonarr/f/f.mkv', '/downloads/sonarr/f')
+    legacy = {'hash': 'c' * 40, 'content_path': '/downloads/y', 'save_path': '/downloads'}
+
+    counts = qbit.get_files_counts(client, [single, legacy])
+
+    assert counts == {'a' * 40: 1, 'c' * 40: 2}
+    assert client.files_calls == ['c' * 40]
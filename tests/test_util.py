@@ -0,0 +1,83 @@
+"""Tests for filesystem helpers in util.py."""
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+import util
+
+
+def test_fast_rmtree_removes_tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "f").write_text("x")
+    (root / "g").write_text("y")
+
+    util.fast_rmtree(str(root))
+
+    assert not root.exists()
+
+
+def test_fast_rmtree_refuses_symlink_to_directory(tmp_path):
+    target = tmp_path / "target"
+    (target / "sub").mkdir(parents=True)
+    (target / "sub" / "data").write_text("keep me")
+    link = tmp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+
+    with pytest.raises(OSError):
+        util.fast_rmtree(str(link))
+
+    assert (target / "sub" / "data").read_text() == "keep me"
+    assert os.path.islink(link)
+
+
+def test_fast_rmtree_unlinks_nested_symlink_without_following(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "data").write_text("keep me")
+    root = tmp_path / "tree"
+    root.mkdir()
+    (root / "link").symlink_to(target, target_is_directory=True)
+
+    util.fast_rmtree(str(root))
+
+    assert not root.exists()
+    assert (target / "data").read_text() == "keep me"
+
+
+def test_cleanup_destination_removes_symlink_only(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "data").write_text("keep me")
+    link = tmp_path / "dest"
+    link.symlink_to(target, target_is_directory=True)
+
+    util.cleanup_destination(str(link))
+
+    assert not os.path.lexists(link)
+    assert (target / "data").read_text() == "keep me"
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="reflink path is Linux-only")
+def test_copy_and_hash_hashes_reflinked_clone(tmp_path, monkeypatch):
+    src, dst = tmp_path / "src.bin", tmp_path / "dst.bin"
+    data = os.urandom(300 * 1024)
+    src.write_bytes(data)
+    cloned = []
+
+    def fake_reflink(src_fd, dst_fd):
+        # Stand-in for FICLONE: dst gets src's contents, file offsets are untouched
+        os.pwrite(dst_fd, os.pread(src_fd, len(data), 0), 0)
+        cloned.append(True)
+        return True
+
+    monkeypatch.setattr(util, '_try_reflink', fake_reflink)
+
+    digest = util.copy_and_hash(str(src), str(dst), algo='sha256')
+
+    assert cloned == [True]
+    assert dst.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()